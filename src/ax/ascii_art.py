@@ -1,15 +1,35 @@
 """ASCII art banners for Arize AX CLI."""
 
-from ax.version import __version__
-
 # Option 1: Classic ASCII
-OPTION_1 = """
+OPTION_1 = r"""
 [bold magenta]     _         _              [bold cyan]  _   __  __[/bold cyan] [/bold magenta]
-[bold magenta]    / \\   _ __(_)_______     [bold cyan]  / \\  \\ \\/ /[/bold cyan] [/bold magenta]
-[bold magenta]   / _ \\ | '__| |_  / _ \\   [bold cyan]  / _ \\  \\  /[/bold cyan] [/bold magenta]
-[bold magenta]  / ___ \\| |  | |/ /  __/    [bold cyan]/ ___ \\ /  \\ [/bold cyan] [/bold magenta]
-[bold magenta] /_/   \\_\\_|  |_/___\\___|  [bold cyan] /_/   \\_\\_/\\_\\[/bold cyan] [/bold magenta]
+[bold magenta]    / \   _ __(_)_______     [bold cyan]  / \  \ \/ /[/bold cyan] [/bold magenta]
+[bold magenta]   / _ \ | '__| |_  / _ \   [bold cyan]  / _ \  \  /[/bold cyan] [/bold magenta]
+[bold magenta]  / ___ \| |  | |/ /  __/    [bold cyan]/ ___ \ /  \ [/bold cyan] [/bold magenta]
+[bold magenta] /_/   \_\_|  |_/___\___|  [bold cyan] /_/   \_\_/\_\[/bold cyan] [/bold magenta]
 [dim cyan]                 AI Observability Platform (v{version})[/dim cyan]"""
 
-# Default banner (can be changed to any option)
-DEFAULT_BANNER = OPTION_1.format(version=__version__)
+
+def __getattr__(name: str) -> str:
+    """Build the default banner on first access (PEP 562).
+
+    The result is stored in the module namespace, so later lookups find it
+    directly and never reach this function again.
+
+    Args:
+        name: Module attribute being looked up
+
+    Returns:
+        The formatted banner for DEFAULT_BANNER
+
+    Raises:
+        AttributeError: If the attribute is not defined in this module
+    """
+    # Default banner (can be changed to any option)
+    if name == "DEFAULT_BANNER":
+        from ax.version import __version__
+
+        banner = OPTION_1.format(version=__version__)
+        globals()["DEFAULT_BANNER"] = banner
+        return banner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
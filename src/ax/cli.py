@@ -1,19 +1,81 @@
 """Main CLI entry point using Typer."""
 
-import logging
-from typing import Annotated
+import importlib
+from typing import Annotated, Any, ClassVar
 
 import typer
-from arize.logging import configure_logging
+from typer.core import TyperCommand, TyperGroup
 
 from ax.utils.console import text
 from ax.version import __version__
 
 # TODO(Kiko): Ensure that every command has @handle_errors decorator
 
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group that imports command group modules only when invoked.
+
+    Each entry in `lazy_subcommands` maps a command name to the module that
+    defines its Typer app and the help text shown in `ax --help`. Listing the
+    commands (help output, shell completion) uses lightweight placeholders,
+    so only the module for the subcommand actually run is ever imported.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, tuple[str, str]]] = {
+        "datasets": ("ax.commands.datasets", "Manage datasets"),
+        "projects": ("ax.commands.projects", "Manage projects"),
+        "config": ("ax.commands.config", "Manage configuration"),
+        "cache": ("ax.commands.cache", "Manage cache"),
+    }
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Register placeholders for the lazily loaded command groups."""
+        super().__init__(**kwargs)
+        self._listing = False
+        for name, (_, help_text) in self.lazy_subcommands.items():
+            self.commands[name] = TyperCommand(name=name, help=help_text)
+
+    def get_command(
+        self, ctx: typer.Context, cmd_name: str
+    ) -> TyperCommand | TyperGroup | None:
+        """Return a command, importing its module on first real use."""
+        cmd = super().get_command(ctx, cmd_name)  # type: ignore[assignment]
+        if self._listing or cmd_name not in self.lazy_subcommands:
+            return cmd
+        if isinstance(cmd, TyperGroup):
+            return cmd
+
+        module_path, help_text = self.lazy_subcommands[cmd_name]
+        module = importlib.import_module(module_path)
+        # Mount through add_typer so the group is built exactly as a
+        # statically registered sub-app would be
+        parent = typer.Typer(rich_markup_mode=self.rich_markup_mode)
+        parent.add_typer(module.app, name=cmd_name, help=help_text)
+        cmd = typer.main.get_group(parent).commands[cmd_name]
+        self.commands[cmd_name] = cmd
+        return cmd  # type: ignore[return-value]
+
+    def format_help(self, ctx: typer.Context, formatter: Any) -> None:  # noqa: ANN401
+        """Render help without importing any command group module."""
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx: typer.Context, incomplete: str) -> list[Any]:
+        """Complete command names without importing any command module."""
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
+
 # Create main app
 app = typer.Typer(
     name="ax",
+    cls=LazyCommandGroup,
     help="Arize CLI - Manage datasets, experiments, and more",
     add_completion=True,
     rich_markup_mode="rich",
@@ -50,6 +112,12 @@ def main(
 
     Use 'ax COMMAND --help' for more information on a command.
     """
+    # Imported here so `ax --help` and `ax --version`, which exit from eager
+    # options before this body runs, never load the Arize SDK
+    import logging
+
+    from arize.logging import configure_logging
+
     # Configure logging for the Arize SDK based on verbose mode
     if verbose:
         # Show all SDK logs in verbose mode
@@ -59,24 +127,5 @@ def main(
         configure_logging(level=logging.CRITICAL, structured=False)
 
 
-# Import and register command groups
-# These will be implemented in separate files
-def register_commands() -> None:
-    """Register all command groups."""
-    from ax.commands.cache import app as cache_app
-    from ax.commands.config import app as config_app
-    from ax.commands.datasets import app as datasets_app
-    from ax.commands.projects import app as projects_app
-
-    app.add_typer(datasets_app, name="datasets", help="Manage datasets")
-    app.add_typer(projects_app, name="projects", help="Manage projects")
-    app.add_typer(config_app, name="config", help="Manage configuration")
-    app.add_typer(cache_app, name="cache", help="Manage cache")
-
-
-# Register commands on module import
-register_commands()
-
-
 if __name__ == "__main__":
     app()
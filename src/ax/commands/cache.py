@@ -1,9 +1,12 @@
+import shutil
+import uuid
 from typing import Annotated
 
 import typer
 
 from ax.config.manager import ConfigManager
 from ax.core.decorators import handle_errors
+from ax.core.options import VerboseOption
 from ax.utils.console import confirm, info, success
 
 # Create config subcommand app
@@ -26,14 +29,7 @@ def clear_cache(
             help="Profile to show (uses active if not specified)",
         ),
     ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    verbose: VerboseOption = False,
 ) -> None:
     """Clear the Arize SDK cache directory.
 
@@ -47,8 +43,12 @@ def clear_cache(
     cache_dir = config.storage.cache_dir
 
     if cache_dir.exists() and cache_dir.is_dir():
-        import shutil
-
-        shutil.rmtree(cache_dir)
+        # Swap in an empty directory first so the cache is usable again
+        # right away, then delete the old contents
+        trash_dir = cache_dir.with_name(
+            f"{cache_dir.name}.trash-{uuid.uuid4().hex}"
+        )
+        cache_dir.rename(trash_dir)
         cache_dir.mkdir(parents=True, exist_ok=True)
+        shutil.rmtree(trash_dir)
     success("Cache cleared successfully")
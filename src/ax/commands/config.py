@@ -4,23 +4,13 @@ import os
 from typing import Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from ax.ascii_art import DEFAULT_BANNER
 from ax.config.manager import ConfigManager
-from ax.config.schema import (
-    AuthConfig,
-    Config,
-)
-from ax.config.setup import (
-    create_config_from_env_vars,
-    create_config_interactively,
-    detect_env_vars,
-)
 from ax.core.decorators import handle_errors
+from ax.core.options import VerboseOption
 from ax.utils.console import (
     confirm,
+    console,
     emphasis,
     info,
     mask,
@@ -39,20 +29,11 @@ app = typer.Typer(
     context_settings={"help_option_names": ["--help", "-h"]},
 )
 
-console = Console()
-
 
 @app.command("init")
 @handle_errors
 def init(
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    verbose: VerboseOption = False,
 ) -> None:
     """Initialize Arize CLI configuration interactively.
 
@@ -60,6 +41,12 @@ def init(
     preferences. Detects existing ARIZE_* environment variables and offers
     to create config from them.
     """
+    from ax.config.setup import (
+        create_config_from_env_vars,
+        create_config_interactively,
+        detect_env_vars,
+    )
+
     existing_profiles = ConfigManager.list_profiles()
 
     # Profile Selection
@@ -71,6 +58,8 @@ def init(
         profile = typer.prompt("profile name")
         new_line()
     else:
+        from ax.ascii_art import DEFAULT_BANNER
+
         # Display ASCII art welcome banner
         new_line()
         text(DEFAULT_BANNER)
@@ -128,14 +117,7 @@ def init(
 @app.command("list")
 @handle_errors
 def list_profiles(
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    verbose: VerboseOption = False,
 ) -> None:
     """List all available configuration profiles.
 
@@ -147,6 +129,8 @@ def list_profiles(
         info("No profiles found. Run 'ax config init' to create one.")
         raise typer.Exit()
 
+    from rich.table import Table
+
     active = ConfigManager.get_active_profile()
 
     table = Table(show_header=True, header_style="bold cyan")
@@ -186,14 +170,7 @@ def show_profile(
             help="Expand environment variable references",
         ),
     ] = False,
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    verbose: VerboseOption = False,
 ) -> None:
     """Show configuration for a profile.
 
@@ -201,93 +178,104 @@ def show_profile(
     Use --expand to show expanded values.
     Use --all to show all sections including defaults.
     """
-    # Use profile from context if not specified
-    config = ConfigManager.load(profile, expand_vars)
+    from ax.config.schema import AuthConfig, Config
+
+    # Use the active profile if not specified
+    config, active = ConfigManager.load_with_active(profile, expand_vars)
+    profile = profile or active
 
     # Display configuration
     text_bold(f"\nProfile: {profile}")
-    if profile == ConfigManager.get_active_profile():
+    if profile == active:
         console.print("[green](active)[/green]")
     new_line()
 
-    # Determine which sections to show
-    default_config = Config(
-        auth=AuthConfig(api_key="dummy"),
-    )
+    # Determine which optional sections to show: all of them with --all,
+    # otherwise only those with customized (non-default) values
+    optional_sections = ("routing", "transport", "security", "storage")
+    if all_sections:
+        shown = set(optional_sections)
+    else:
+        default_config = Config(auth=AuthConfig(api_key="dummy"))
+        shown = {
+            name
+            for name in optional_sections
+            if getattr(config, name) != getattr(default_config, name)
+        }
 
-    def is_customized(section_name: str) -> bool:
-        """Check if a section has customized (non-default) values."""
-        if section_name == "profile" or section_name == "auth":
-            return True  # Always show these
-        config_section = getattr(config, section_name)
-        default_section = getattr(default_config, section_name, None)
-        if default_section is None:
-            return True
-        return config_section != default_section
+    # Collect the output and print it in one go rather than line by line
+    lines: list[str] = []
+
+    def section(title: str) -> None:
+        lines.append(f"[bold blue]{title}[/bold blue]")
 
     # Auth section (always shown)
-    emphasis("Authentication:")
+    section("Authentication:")
     key = config.auth.api_key
     key = key if _is_env_var_ref(key) else mask(key)
-    text(f"  API Key: {key}")
+    lines.append(f"  API Key: {key}")
 
     # Routing section
-    if all_sections or is_customized("routing"):
-        emphasis("\nRouting:")
+    if "routing" in shown:
+        section("\nRouting:")
         if config.routing.region:
-            text(f"  Region: {config.routing.region}")
+            lines.append(f"  Region: {config.routing.region}")
         if config.routing.single_host:
-            text(f"  Single Host: {config.routing.single_host}")
+            lines.append(f"  Single Host: {config.routing.single_host}")
         if config.routing.single_port:
-            text(f"  Single Port: {config.routing.single_port}")
+            lines.append(f"  Single Port: {config.routing.single_port}")
         if config.routing.base_domain:
-            text(f"  Base Domain: {config.routing.base_domain}")
+            lines.append(f"  Base Domain: {config.routing.base_domain}")
         if not (
             config.routing.region
             or config.routing.single_host
             or config.routing.base_domain
         ):
-            text(f"  API Scheme: {config.routing.api_scheme}")
-            text(f"  API Host: {config.routing.api_host}")
-            text(f"  OTLP Scheme: {config.routing.otlp_scheme}")
-            text(f"  OTLP Host: {config.routing.otlp_host}")
-            text(f"  Flight Scheme: {config.routing.flight_scheme}")
-            text(f"  Flight Host: {config.routing.flight_host}")
-            text(f"  Flight Port: {config.routing.flight_port}")
+            lines.extend(
+                [
+                    f"  API Scheme: {config.routing.api_scheme}",
+                    f"  API Host: {config.routing.api_host}",
+                    f"  OTLP Scheme: {config.routing.otlp_scheme}",
+                    f"  OTLP Host: {config.routing.otlp_host}",
+                    f"  Flight Scheme: {config.routing.flight_scheme}",
+                    f"  Flight Host: {config.routing.flight_host}",
+                    f"  Flight Port: {config.routing.flight_port}",
+                ]
+            )
 
     # Transport section
-    if all_sections or is_customized("transport"):
-        emphasis("\nTransport:")
-        text(f"  Stream Max Workers: {config.transport.stream_max_workers}")
-        text(
-            f"  Stream Max Queue Bound: {config.transport.stream_max_queue_bound}"
-        )
-        text(
-            f"  PyArrow Max Chunksize: {config.transport.pyarrow_max_chunksize}"
-        )
-        text(
-            f"  Max HTTP Payload Size: {config.transport.max_http_payload_size_mb} MB"
+    if "transport" in shown:
+        section("\nTransport:")
+        transport = config.transport
+        lines.extend(
+            [
+                f"  Stream Max Workers: {transport.stream_max_workers}",
+                f"  Stream Max Queue Bound: {transport.stream_max_queue_bound}",
+                f"  PyArrow Max Chunksize: {transport.pyarrow_max_chunksize}",
+                f"  Max HTTP Payload Size: {transport.max_http_payload_size_mb} MB",
+            ]
         )
 
     # Security section
-    if all_sections or is_customized("security"):
-        emphasis("\nSecurity:")
+    if "security" in shown:
+        section("\nSecurity:")
         val = config.security.request_verify
         if _is_bool(str(config.security.request_verify)):
             val = bool(config.security.request_verify)
-        text(f"  Request Verify: {val}")
+        lines.append(f"  Request Verify: {val}")
 
     # Storage section
-    if all_sections or is_customized("storage"):
-        emphasis("\nStorage:")
-        text(f"  Directory: {config.storage.directory}")
-        text(f"  Cache: {config.storage.cache_enabled}")
+    if "storage" in shown:
+        section("\nStorage:")
+        lines.append(f"  Directory: {config.storage.directory}")
+        lines.append(f"  Cache: {config.storage.cache_enabled}")
 
     # Output section (always shown)
-    emphasis("\nOutput:")
-    text(f"  Format: {config.output.format}")
+    section("\nOutput:")
+    lines.append(f"  Format: {config.output.format}")
+    lines.append("")
 
-    new_line()
+    console.print("\n".join(lines))
 
 
 @app.command("use")
@@ -297,14 +285,7 @@ def use_profile(
         str,
         typer.Argument(help="Profile name to activate"),
     ],
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    verbose: VerboseOption = False,
 ) -> None:
     """Switch to a different configuration profile.
 
@@ -329,14 +310,7 @@ def delete_profile(
             help="Skip confirmation",
         ),
     ] = False,
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    verbose: VerboseOption = False,
 ) -> None:
     """Delete a configuration profile.
 
@@ -1,19 +1,17 @@
 """Dataset management commands."""
 
-from dataclasses import asdict
 from pathlib import Path
 from typing import Annotated
 
 import typer
-from arize import ArizeClient
-from click import confirm
-from rich.console import Console
 
 from ax.config.manager import ConfigManager
+from ax.core.client import get_client
 from ax.core.decorators import handle_errors
 from ax.core.exceptions import APIError
-from ax.core.output import output_data
+from ax.core.options import OutputOption, ProfileOption, VerboseOption
 from ax.utils.console import (
+    confirm,
     info,
     new_line,
     spinner,
@@ -21,10 +19,6 @@ from ax.utils.console import (
     text_dimmed,
     warning,
 )
-from ax.utils.file_io import (
-    parse_output_option,
-    read_data_file,
-)
 
 # Create datasets subcommand app
 app = typer.Typer(
@@ -34,8 +28,6 @@ app = typer.Typer(
     context_settings={"help_option_names": ["--help", "-h"]},
 )
 
-console = Console()
-
 
 @app.command("list")
 @handle_errors
@@ -62,40 +54,23 @@ def list_datasets(
             help="Pagination cursor for next page",
         ),
     ] = None,
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """List datasets in a space."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     # Resolve with helper functions
     output_format, output_file = parse_output_option(
         output if output else config.output.format
     )
 
+    client = get_client(profile)
+
     try:
         with spinner("Fetching datasets"):
             response = client.datasets.list(
@@ -122,40 +97,23 @@ def get_dataset(
         str,
         typer.Argument(help="Dataset ID"),
     ],
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """Get a dataset by ID."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     # Resolve with helper functions
     output_format, output_file = parse_output_option(
         output if output else config.output.format
     )
 
+    client = get_client(profile)
+
     try:
         dataset = client.datasets.get(dataset_id=id)
     except Exception as e:
@@ -198,34 +156,15 @@ def create_dataset(
             prompt=True,
         ),
     ],
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """Create a new dataset from a data file."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option, read_data_file
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     output_format, output_file = parse_output_option(
         output if output else config.output.format
@@ -234,6 +173,8 @@ def create_dataset(
     # Read data file
     df = read_data_file(str(file))
 
+    client = get_client(profile)
+
     try:
         # Create dataset
         with spinner(
@@ -274,28 +215,11 @@ def delete_dataset(
             help="Skip confirmation prompt",
         ),
     ] = False,
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """Delete a dataset by ID."""
-    config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
-
-    # Confirm deletion
+    # Confirm deletion before loading config or the SDK
     if not force:
         warning("Warning: This will permanently delete the dataset")
 
@@ -303,6 +227,8 @@ def delete_dataset(
             info("Dataset not deleted")
             raise typer.Exit()
 
+    client = get_client(profile)
+
     # Delete dataset
     try:
         client.datasets.delete(dataset_id=id)
@@ -334,40 +260,23 @@ def list_examples(
             help="Maximum number of examples to return",
         ),
     ] = 30,
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """List examples from a dataset."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     # Resolve with helper functions
     output_format, output_file = parse_output_option(
         output if output else config.output.format
     )
 
+    client = get_client(profile)
+
     try:
         # Get examples
         response = client.datasets.list_examples(
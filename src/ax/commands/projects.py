@@ -1,21 +1,15 @@
 """Project management commands."""
 
-from dataclasses import asdict
 from typing import Annotated
 
 import typer
-from arize import ArizeClient
-from click import confirm
-from rich.console import Console
 
 from ax.config.manager import ConfigManager
+from ax.core.client import get_client
 from ax.core.decorators import handle_errors
 from ax.core.exceptions import APIError
-from ax.core.output import output_data
-from ax.utils.console import info, spinner, success, warning
-from ax.utils.file_io import (
-    parse_output_option,
-)
+from ax.core.options import OutputOption, ProfileOption, VerboseOption
+from ax.utils.console import confirm, info, spinner, success, warning
 
 # Create projects subcommand app
 app = typer.Typer(
@@ -25,8 +19,6 @@ app = typer.Typer(
     context_settings={"help_option_names": ["--help", "-h"]},
 )
 
-console = Console()
-
 
 @app.command("list")
 @handle_errors
@@ -53,40 +45,23 @@ def list_projects(
             help="Pagination cursor for next page",
         ),
     ] = None,
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """List projects in a space."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     # Resolve with helper functions
     output_format, output_file = parse_output_option(
         output if output else config.output.format
     )
 
+    client = get_client(profile)
+
     try:
         with spinner("Fetching projects"):
             response = client.projects.list(
@@ -126,38 +101,22 @@ def create_project(
             prompt=True,
         ),
     ],
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """Create a new project."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     output_format, output_file = parse_output_option(
         output if output else config.output.format
     )
+
+    client = get_client(profile)
+
     try:
         # Create project
         with spinner(
@@ -185,40 +144,23 @@ def get_project(
         str,
         typer.Argument(help="Project ID"),
     ],
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    output: Annotated[
-        str,
-        typer.Option(
-            "--output",
-            "-o",
-            help="Output format (table, json, csv, parquet) or file path",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    output: OutputOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """Get a project by ID."""
+    from ax.core.output import output_data
+    from ax.utils.file_io import parse_output_option
+
     config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
 
     # Resolve with helper functions
     output_format, output_file = parse_output_option(
         output if output else config.output.format
     )
 
+    client = get_client(profile)
+
     try:
         project = client.projects.get(project_id=id)
     except Exception as e:
@@ -246,28 +188,11 @@ def delete_project(
             help="Skip confirmation prompt",
         ),
     ] = False,
-    profile: Annotated[
-        str,
-        typer.Option(
-            "--profile",
-            "-p",
-            help="Configuration profile to use",
-        ),
-    ] = "",
-    verbose: Annotated[
-        bool,
-        typer.Option(
-            "--verbose",
-            "-v",
-            help="Enable verbose logs",
-        ),
-    ] = False,
+    profile: ProfileOption = "",
+    verbose: VerboseOption = False,
 ) -> None:
     """Delete a project by ID."""
-    config = ConfigManager.load(profile, expand_env_vars=True)
-    client = ArizeClient(**asdict(config.to_sdk_config()))
-
-    # Confirm deletion
+    # Confirm deletion before loading config or the SDK
     if not force:
         warning("Warning: This will permanently delete the project")
 
@@ -275,6 +200,8 @@ def delete_project(
             info("Project not deleted")
             raise typer.Exit()
 
+    client = get_client(profile)
+
     # Delete project
     try:
         client.projects.delete(project_id=id)
@@ -5,12 +5,12 @@ Provides interactive prompts to gather configuration values from the user.
 It supports reading from user input and environment variables.
 """
 
+from collections.abc import Callable
 from enum import Enum
+from functools import cache
 from typing import Literal
 
 import questionary
-from arize import Region
-from rich.console import Console
 
 from ax.config.schema import (
     RoutingConfig,
@@ -19,11 +19,10 @@ from ax.config.schema import (
 )
 from ax.utils.console import prompt
 
-console = Console()
-
 INSERT_VALUE = "Insert value"
 USE_ENV_VAR = "Use environment variable"
 UNSET_REGION_MSG = "(leave empty for unset)"
+INSERT_OR_ENV_CHOICES = (INSERT_VALUE, USE_ENV_VAR)
 
 
 class AdvancedRoutingOpts(Enum):
@@ -36,54 +35,36 @@ class AdvancedRoutingOpts(Enum):
     CUSTOM_ENDPOINTS = "4 - Custom endpoints & ports"
 
 
-def read_str_field(
+def _read_field(
     msg: str, example: str, env_var: str, hide_input: bool = False
 ) -> str:
-    """Read a string field from user input or environment variable."""
-    choices = [
-        INSERT_VALUE,
-        USE_ENV_VAR,
-    ]
+    """Read a field value from user input or an environment variable reference."""
     choice = questionary.select(
         f"{msg}:",
-        choices=choices,
-        default=choices[0],
+        choices=INSERT_OR_ENV_CHOICES,
+        default=INSERT_VALUE,
     ).ask()
     if choice == USE_ENV_VAR:
         choice = prompt(
             f"Environment variable name for {msg}",
             default=env_var,
         )
-        value = f"${{{choice}}}"
-    else:
-        value = prompt(f"{msg} (e.g., {example})", hide_input=hide_input)
+        return f"${{{choice}}}"
+    return prompt(f"{msg} (e.g., {example})", hide_input=hide_input)
 
-    return value
+
+def read_str_field(
+    msg: str, example: str, env_var: str, hide_input: bool = False
+) -> str:
+    """Read a string field from user input or environment variable."""
+    return _read_field(msg, example, env_var, hide_input)
 
 
 def read_int_field(
     msg: str, example: str, env_var: str, hide_input: bool = False
 ) -> int | str:
     """Read an integer field from user input or environment variable."""
-    choices = [
-        INSERT_VALUE,
-        USE_ENV_VAR,
-    ]
-    choice = questionary.select(
-        f"{msg}:",
-        choices=choices,
-        default=choices[0],
-    ).ask()
-    if choice == USE_ENV_VAR:
-        choice = prompt(
-            f"Environment variable name for {msg}",
-            default=env_var,
-        )
-        value = f"${{{choice}}}"
-    else:
-        value = prompt(f"{msg} (e.g., {example})", hide_input=hide_input)
-
-    return value
+    return _read_field(msg, example, env_var, hide_input)
 
 
 def read_api_key() -> str:
@@ -96,11 +77,19 @@ def read_api_key() -> str:
     )
 
 
+@cache
+def _region_choices() -> tuple[str, ...]:
+    """Get the selectable regions, computed once per process."""
+    from arize import Region
+
+    return tuple(Region.list_regions())
+
+
 def read_region() -> str:
     """Read the region from user selection or environment variable."""
     choices = [
         UNSET_REGION_MSG,
-        *Region.list_regions(),
+        *_region_choices(),
         USE_ENV_VAR,
     ]
     region_choice = questionary.select(
@@ -119,6 +108,96 @@ def read_region() -> str:
     return region
 
 
+def _read_region_routing() -> RoutingConfig:
+    """Read region-based routing from user input."""
+    return RoutingConfig(region=read_region())
+
+
+def _read_single_endpoint_routing() -> RoutingConfig:
+    """Read single endpoint routing from user input."""
+    single_host = read_str_field(
+        msg="Single endpoint host",
+        example="api.my.company.com",
+        env_var="ARIZE_SINGLE_HOST",
+    )
+    single_port = read_str_field(
+        msg="Single endpoint port",
+        example="443",
+        env_var="ARIZE_SINGLE_PORT",
+    )
+    return RoutingConfig(
+        single_host=single_host,
+        single_port=single_port,
+    )
+
+
+def _read_base_domain_routing() -> RoutingConfig:
+    """Read base domain routing from user input."""
+    base_domain = read_str_field(
+        msg="Base domain",
+        example="my.company.com",
+        env_var="ARIZE_BASE_DOMAIN",
+    )
+    return RoutingConfig(base_domain=base_domain)
+
+
+def _read_custom_endpoints_routing() -> RoutingConfig:
+    """Read custom endpoint routing from user input."""
+    api_scheme = read_str_field(
+        msg="API scheme",
+        example="https, http",
+        env_var="ARIZE_API_SCHEME",
+    )
+    api_host = read_str_field(
+        msg="API host",
+        example="custom-api.my.company.com",
+        env_var="ARIZE_API_HOST",
+    )
+    otlp_scheme = read_str_field(
+        msg="OTLP scheme",
+        example="https, http",
+        env_var="ARIZE_OTLP_SCHEME",
+    )
+    otlp_host = read_str_field(
+        msg="OTLP host",
+        example="custom-otlp.my.company.com",
+        env_var="ARIZE_OTLP_HOST",
+    )
+    flight_scheme = read_str_field(
+        msg="Flight scheme",
+        example="grpc+tls, grpc",
+        env_var="ARIZE_FLIGHT_SCHEME",
+    )
+    flight_host = read_str_field(
+        msg="Flight host",
+        example="custom-flight.my.company.com",
+        env_var="ARIZE_FLIGHT_HOST",
+    )
+    flight_port = read_str_field(
+        msg="Flight port",
+        example="443",
+        env_var="ARIZE_FLIGHT_PORT",
+    )
+    return RoutingConfig(
+        api_scheme=api_scheme,
+        api_host=api_host,
+        otlp_scheme=otlp_scheme,
+        otlp_host=otlp_host,
+        flight_scheme=flight_scheme,
+        flight_host=flight_host,
+        flight_port=flight_port,
+    )
+
+
+# Routing readers by selected option; NONE falls back to the defaults
+ROUTING_READERS: dict[str, Callable[[], RoutingConfig]] = {
+    AdvancedRoutingOpts.REGION.value: _read_region_routing,
+    AdvancedRoutingOpts.SINGLE_ENDPOINT.value: _read_single_endpoint_routing,
+    AdvancedRoutingOpts.BASE_DOMAIN.value: _read_base_domain_routing,
+    AdvancedRoutingOpts.CUSTOM_ENDPOINTS.value: _read_custom_endpoints_routing,
+}
+
+
 def read_routing() -> RoutingConfig:
     """Read routing configuration from user input."""
     choices = [opt.value for opt in AdvancedRoutingOpts]
@@ -126,78 +205,7 @@ def read_routing() -> RoutingConfig:
         "What type of override should we setup?",
         choices=choices,
     ).ask()
-    match choice:
-        case AdvancedRoutingOpts.REGION.value:
-            return RoutingConfig(region=read_region())
-        case AdvancedRoutingOpts.SINGLE_ENDPOINT.value:
-            single_host = read_str_field(
-                msg="Single endpoint host",
-                example="api.my.company.com",
-                env_var="ARIZE_SINGLE_HOST",
-            )
-            single_port = read_str_field(
-                msg="Single endpoint port",
-                example="443",
-                env_var="ARIZE_SINGLE_PORT",
-            )
-            return RoutingConfig(
-                single_host=single_host,
-                single_port=single_port,
-            )
-        case AdvancedRoutingOpts.BASE_DOMAIN.value:
-            base_domain = read_str_field(
-                msg="Base domain",
-                example="my.company.com",
-                env_var="ARIZE_BASE_DOMAIN",
-            )
-            return RoutingConfig(base_domain=base_domain)
-        case AdvancedRoutingOpts.CUSTOM_ENDPOINTS.value:
-            api_scheme = read_str_field(
-                msg="API scheme",
-                example="https, http",
-                env_var="ARIZE_API_SCHEME",
-            )
-            api_host = read_str_field(
-                msg="API host",
-                example="custom-api.my.company.com",
-                env_var="ARIZE_API_HOST",
-            )
-            otlp_scheme = read_str_field(
-                msg="OTLP scheme",
-                example="https, http",
-                env_var="ARIZE_OTLP_SCHEME",
-            )
-            otlp_host = read_str_field(
-                msg="OTLP host",
-                example="custom-otlp.my.company.com",
-                env_var="ARIZE_OTLP_HOST",
-            )
-            flight_scheme = read_str_field(
-                msg="Flight scheme",
-                example="grpc+tls, grpc",
-                env_var="ARIZE_FLIGHT_SCHEME",
-            )
-            flight_host = read_str_field(
-                msg="Flight host",
-                example="custom-flight.my.company.com",
-                env_var="ARIZE_FLIGHT_HOST",
-            )
-            flight_port = read_str_field(
-                msg="Flight port",
-                example="443",
-                env_var="ARIZE_FLIGHT_PORT",
-            )
-            return RoutingConfig(
-                api_scheme=api_scheme,
-                api_host=api_host,
-                otlp_scheme=otlp_scheme,
-                otlp_host=otlp_host,
-                flight_scheme=flight_scheme,
-                flight_host=flight_host,
-                flight_port=flight_port,
-            )
-
-    return RoutingConfig()
+    return ROUTING_READERS.get(choice, RoutingConfig)()
 
 
 def read_request_verify() -> bool | str:
@@ -2,18 +2,24 @@
 
 import os
 import re
+import shutil
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, TypeVar, overload
+from typing import Any, ClassVar, TypeVar, overload
 
-import tomli_w
-import tomllib
 from pydantic import ValidationError
 
-from ax.config.schema import Config
+from ax.config.schema import Config, ProfileConfig
 from ax.core.exceptions import ConfigError
 
 T = TypeVar("T")
 
+# Strings parsed as True by _to_bool (after strip/lower)
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+# Pattern: ${VAR_NAME} or ${VAR_NAME:default}
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
+
 
 class ConfigManager:
     """Manage configuration files and profiles."""
@@ -23,6 +29,25 @@ class ConfigManager:
     DEFAULT_CONFIG_FILE = CONFIG_DIR / "config.toml"
     ACTIVE_PROFILE_FILE = CONFIG_DIR / ".active_profile"
 
+    # Per-process caches, tagged with the file's mtime_ns (and, for configs,
+    # size and the values of referenced env vars) so that edits made outside
+    # ConfigManager are picked up; dropped whenever ConfigManager writes
+    _config_cache: ClassVar[
+        dict[
+            tuple[Path, bool],
+            tuple[tuple[int, int], tuple[tuple[str, str | None], ...], Config],
+        ]
+    ] = {}
+    _active_profile_cache: ClassVar[dict[Path, tuple[int | None, str]]] = {}
+    _profiles_cache: ClassVar[dict[Path, tuple[int, frozenset[str]]]] = {}
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop cached configs, active profile and profile listings."""
+        cls._config_cache.clear()
+        cls._active_profile_cache.clear()
+        cls._profiles_cache.clear()
+
     @classmethod
     def list_profiles(cls) -> list[str]:
         """List all available profiles.
@@ -31,12 +56,7 @@ class ConfigManager:
             List of profile names
         """
         profiles = ["default"] if cls.DEFAULT_CONFIG_FILE.exists() else []
-
-        if cls.PROFILES_DIR.exists():
-            profiles.extend(
-                path.stem for path in cls.PROFILES_DIR.glob("*.toml")
-            )
-
+        profiles.extend(cls._named_profiles())
         return sorted(profiles)
 
     @classmethod
@@ -49,7 +69,9 @@ class ConfigManager:
         Returns:
             True if config exists
         """
-        return cls._get_config_path(profile).exists()
+        if profile == "default":
+            return cls.DEFAULT_CONFIG_FILE.exists()
+        return profile in cls._named_profiles()
 
     @classmethod
     def get_active_profile(cls) -> str:
@@ -58,14 +80,25 @@ class ConfigManager:
         Returns:
             Active profile name (defaults to "default")
         """
+        try:
+            mtime_ns: int | None = cls.ACTIVE_PROFILE_FILE.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = cls._active_profile_cache.get(cls.ACTIVE_PROFILE_FILE)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        active = "default"
         # Check active profile file
-        if cls.ACTIVE_PROFILE_FILE.exists():
+        if mtime_ns is not None:
             try:
-                return cls.ACTIVE_PROFILE_FILE.read_text().strip()
+                active = cls.ACTIVE_PROFILE_FILE.read_text().strip()
             except Exception:
-                return "default"
+                active = "default"
 
-        return "default"
+        cls._active_profile_cache[cls.ACTIVE_PROFILE_FILE] = (mtime_ns, active)
+        return active
 
     @classmethod
     def set_active_profile(cls, profile: str) -> None:
@@ -83,6 +116,7 @@ class ConfigManager:
                 f"Available profiles: {', '.join(cls.list_profiles())}"
             )
         cls.ACTIVE_PROFILE_FILE.write_text(profile)
+        cls.cache_clear()
 
     @classmethod
     def delete_profile(cls, profile: str) -> None:
@@ -106,12 +140,17 @@ class ConfigManager:
         config_path = cls._get_config_path(profile)
         if config_path.exists():
             config_path.unlink()
+        cls.cache_clear()
 
     @classmethod
     def load(cls, profile: str, expand_env_vars: bool = True) -> Config:
         """Load configuration from file with env var expansion.
 
         Expands ${VAR} and ${VAR:default} references in string values.
+        Results are cached per process until the file's modification time
+        or size, or the value of an env var it references, changes, so
+        repeated calls with the same arguments return the same Config
+        instance. Callers must not mutate it.
 
         Args:
             profile: Profile name. If empty, uses active profile or default.
@@ -127,32 +166,85 @@ class ConfigManager:
             profile = cls.get_active_profile()
 
         config_path = cls._get_config_path(profile)
-
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except OSError:
             raise ConfigError(
                 f"Profile '{profile}' not found.\n\n"
                 "Run 'ax config init' to create a configuration.\n"
                 "Or specify a different profile with --profile"
-            )
+            ) from None
+
+        # Size catches same-tick rewrites on filesystems with coarse mtimes
+        file_tag = (stat.st_mtime_ns, stat.st_size)
+        cache_key = (config_path, expand_env_vars)
+        cached = cls._config_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == file_tag
+            and all(os.environ.get(name) == value for name, value in cached[1])
+        ):
+            return cached[2]
+
+        # Imported here so commands that never parse a config skip the cost
+        import tomllib
 
         try:
-            with open(config_path, "rb") as f:
-                data = tomllib.load(f)
-
-            if expand_env_vars:
-                # Expand environment variable references
+            content = config_path.read_bytes().decode()
+            data = tomllib.loads(content)
+
+            # Expand environment variable references; most configs have
+            # none, so one scan of the raw text lets them skip the walk
+            env_refs: tuple[tuple[str, str | None], ...] = ()
+            if expand_env_vars and "${" in content:
+                # Snapshot the referenced values, so the cached config is
+                # dropped if any of them change
+                env_refs = tuple(
+                    (name, os.environ.get(name))
+                    for name in dict.fromkeys(
+                        match.group(1)
+                        for match in _ENV_VAR_PATTERN.finditer(content)
+                    )
+                )
                 data = _expand_config_dict(data)
 
-            return Config(**data)
+            config = Config(**data)
         except ValidationError as e:
             raise ConfigError(f"Invalid config file: {e}") from e
         except Exception as e:
             raise ConfigError(f"Failed to load config: {e}") from e
 
+        cls._config_cache[cache_key] = (file_tag, env_refs, config)
+        return config
+
+    @classmethod
+    def load_with_active(
+        cls, profile: str, expand_env_vars: bool = True
+    ) -> tuple[Config, str]:
+        """Load configuration together with the active profile name.
+
+        Args:
+            profile: Profile name. If empty, uses active profile or default.
+            expand_env_vars: Whether to expand environment variable references
+
+        Returns:
+            Tuple of (config, active profile name)
+
+        Raises:
+            ConfigError: If config file doesn't exist or is invalid
+        """
+        active = cls.get_active_profile()
+        return cls.load(profile or active, expand_env_vars), active
+
     @classmethod
     def save(cls, config: Config, profile: str = "default") -> None:
         """Save configuration to file.
 
+        The file is replaced atomically, so readers see either the old or
+        the new config. An existing file keeps its permissions (new files
+        are created readable by the owner only), and a symlinked config is
+        updated through the link.
+
         Args:
             config: Config object to save
             profile: Profile name
@@ -160,21 +252,67 @@ class ConfigManager:
         Raises:
             ConfigError: If save fails
         """
+        import tomli_w
+
         cls._ensure_dirs()
-        config_path = cls._get_config_path(profile)
+        config_path = cls._get_config_path(profile).resolve()
+        tmp_path = config_path.with_name(f"{config_path.name}.tmp")
 
         try:
-            # Update profile name in config
-            config.profile.name = profile
+            # Record the profile name (configs are frozen, so copy)
+            if config.profile.name != profile:
+                config = config.model_copy(
+                    update={"profile": ProfileConfig(name=profile)}
+                )
 
-            # Convert to dict and write using tomli-w
+            # Convert to dict and serialize using tomli-w
             data = config.model_dump(mode="json", exclude_none=True)
             data = _remove_empty_values(data)
-
-            with open(config_path, "wb") as f:
-                tomli_w.dump(data, f)
+            content = tomli_w.dumps(data).encode()
+
+            # Write to a sibling temp file and swap it in, so an interrupted
+            # save never leaves a truncated config behind
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            if config_path.exists():
+                shutil.copymode(config_path, tmp_path)
+            os.replace(tmp_path, config_path)
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             raise ConfigError(f"Failed to save config: {e}") from e
+        finally:
+            cls.cache_clear()
+
+    @classmethod
+    def _named_profiles(cls) -> frozenset[str]:
+        """Get the names of profiles stored in the profiles directory.
+
+        The listing is cached until the directory's modification time
+        changes, and uses os.scandir so entries are not stat'ed one by one.
+        Only regular files count as profiles.
+
+        Returns:
+            Profile names (without the .toml extension)
+        """
+        try:
+            mtime_ns = cls.PROFILES_DIR.stat().st_mtime_ns
+        except OSError:
+            return frozenset()
+
+        cached = cls._profiles_cache.get(cls.PROFILES_DIR)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with os.scandir(cls.PROFILES_DIR) as entries:
+            names = frozenset(
+                entry.name.removesuffix(".toml")
+                for entry in entries
+                if entry.name.endswith(".toml") and entry.is_file()
+            )
+
+        cls._profiles_cache[cls.PROFILES_DIR] = (mtime_ns, names)
+        return names
 
     @classmethod
     def _ensure_dirs(cls) -> None:
@@ -226,8 +364,6 @@ def _to_float(value: int | float | str) -> float:
     Raises:
         ValueError: If conversion fails
     """
-    if isinstance(value, (int, float)):
-        return float(value)
     return float(value)
 
 
@@ -244,7 +380,10 @@ def _to_bool(value: bool | str) -> bool:
     """
     if isinstance(value, bool):
         return value
-    return str(value).strip().lower() in {"1", "true", "yes", "on"}
+    # Already-normalized strings skip the strip/lower copies
+    if value in _TRUE_VALUES:
+        return True
+    return str(value).strip().lower() in _TRUE_VALUES
 
 
 @overload
@@ -258,10 +397,11 @@ def _remove_empty_values(obj: T) -> T: ...
 def _remove_empty_values(
     obj: dict[str, Any] | T,
 ) -> dict[str, Any] | T:
-    """Recursively remove None and empty string values from nested dicts.
+    """Remove None and empty string values from nested dicts.
 
     This creates cleaner TOML output by excluding unset optional fields.
     When loading configs, Pydantic will apply default values for missing fields.
+    Nested dicts are walked with an explicit stack rather than recursion.
 
     Args:
         obj: Dictionary or other object to process
@@ -269,17 +409,29 @@ def _remove_empty_values(
     Returns:
         Filtered dictionary with None and empty strings removed
     """
-    if isinstance(obj, dict):
-        return {
-            k: _remove_empty_values(v)
-            for k, v in obj.items()
-            if v != "" and v is not None
-        }
-    return obj
+    if not isinstance(obj, dict):
+        return obj
+
+    result: dict[str, Any] = {}
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(obj, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if value == "" or value is None:
+                continue
+            if isinstance(value, dict):
+                nested: dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested))
+            else:
+                target[key] = value
+    return result
 
 
 def _expand_config_dict(data: dict[str, Any]) -> dict[str, Any]:
-    """Recursively expand environment variables in a config dictionary.
+    """Expand environment variables in a nested config dictionary.
+
+    Nested dicts are walked with an explicit stack rather than recursion.
 
     Args:
         data: Configuration dictionary
@@ -288,16 +440,50 @@ def _expand_config_dict(data: dict[str, Any]) -> dict[str, Any]:
         Dictionary with all ${VAR} references expanded
     """
     result: dict[str, Any] = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            result[key] = _expand_config_dict(value)
-        elif isinstance(value, str):
-            result[key] = _expand_env_var(value)
-        else:
-            result[key] = value
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                nested: dict[str, Any] = {}
+                target[key] = nested
+                stack.append((value, nested))
+            elif isinstance(value, str):
+                target[key] = _expand_env_var(value)
+            else:
+                target[key] = value
     return result
 
 
+def _replace_env_var(
+    match: re.Match, _environ: Mapping[str, str] = os.environ
+) -> str:
+    """Resolve a single ${VAR} or ${VAR:default} match.
+
+    Args:
+        match: Match of _ENV_VAR_PATTERN
+        _environ: Environment mapping, bound once as a fast local lookup
+
+    Returns:
+        Environment variable value, or the default if it isn't set
+
+    Raises:
+        ValueError: If the env var is not set and no default is provided
+    """
+    var_name = match.group(1)
+    default_value = match.group(2)
+
+    env_value = _environ.get(var_name)
+
+    if env_value is not None:
+        return env_value
+    if default_value is not None:
+        return default_value
+    raise ValueError(
+        f"Environment variable {var_name} is not set and no default provided"
+    )
+
+
 def _expand_env_var(value: str) -> str:
     """Expand environment variable references in a string.
 
@@ -315,24 +501,8 @@ def _expand_env_var(value: str) -> str:
     Raises:
         ValueError: If required env var is not set
     """
-    if not isinstance(value, str):
+    # Most values are literals, so skip the regex unless a reference is present
+    if not isinstance(value, str) or "${" not in value:
         return value
 
-    # Pattern: ${VAR_NAME} or ${VAR_NAME:default}
-    pattern = r"\$\{([^}:]+)(?::([^}]*))?\}"
-
-    def replace_var(match: re.Match) -> str:
-        var_name = match.group(1)
-        default_value = match.group(2)
-
-        env_value = os.environ.get(var_name)
-
-        if env_value is not None:
-            return env_value
-        if default_value is not None:
-            return default_value
-        raise ValueError(
-            f"Environment variable {var_name} is not set and no default provided"
-        )
-
-    return re.sub(pattern, replace_var, value)
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
@@ -1,21 +1,50 @@
 """Configuration schema using Pydantic models."""
 
+from dataclasses import fields
+from functools import cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from arize import Region, SDKConfiguration
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+if TYPE_CHECKING:
+    from arize import SDKConfiguration
+
+
+@cache
+def _valid_regions() -> tuple[frozenset[str], str]:
+    """Get the literal region values accepted by RoutingConfig.region.
+
+    The arize SDK is imported on first use rather than at module import,
+    since loading it dominates CLI startup time.
+
+    Returns:
+        Tuple of (set of valid regions, comma-separated list for messages)
+    """
+    from arize import Region
+
+    regions = Region.list_regions()
+    return frozenset(regions), ", ".join(regions)
 
 
 class ProfileConfig(BaseModel):
     """Profile metadata."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     name: str = Field(default="default", description="Profile name")
 
 
 class AuthConfig(BaseModel):
     """Authentication credentials."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     api_key: str = Field(description="Arize API key")
 
     @field_validator("api_key")
@@ -40,6 +69,8 @@ class AuthConfig(BaseModel):
 class RoutingConfig(BaseModel):
     """Routing strategy (mutually exclusive options)."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     # Region override
     region: str = Field(default="", description="Region-based routing")
 
@@ -91,11 +122,11 @@ class RoutingConfig(BaseModel):
             return v
 
         # Validate as a literal region
-        valid_regions = Region.list_regions()
+        valid_regions, valid_regions_str = _valid_regions()
         if v not in valid_regions:
             raise ValueError(
                 f"Invalid region: {v}. Must be empty string or one of: "
-                f"{', '.join(valid_regions)}"
+                f"{valid_regions_str}"
             )
         return v
 
@@ -143,7 +174,13 @@ class RoutingConfig(BaseModel):
 
 
 class TransportConfig(BaseModel):
-    """Transport and performance settings."""
+    """Transport and performance settings.
+
+    Fields also accept strings so that "${VAR}" references validate when a
+    profile is loaded without env var expansion (e.g. `ax config show`).
+    """
+
+    model_config = {"frozen": True, "defer_build": True}
 
     stream_max_workers: int | str = Field(default=8)
     stream_max_queue_bound: int | str = Field(default=5_000)
@@ -154,12 +191,16 @@ class TransportConfig(BaseModel):
 class SecurityConfig(BaseModel):
     """Security settings."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     request_verify: bool | str = Field(default=True)
 
 
 class StorageConfig(BaseModel):
     """Storage and caching configuration."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     directory: str = Field(default="~/.arize")
     cache_enabled: bool = Field(default=True)
 
@@ -185,11 +226,17 @@ class StorageConfig(BaseModel):
 class OutputConfig(BaseModel):
     """Output formatting (CLI-specific)."""
 
+    model_config = {"frozen": True, "defer_build": True}
+
     format: Literal["table", "json", "csv", "parquet"] = Field(default="table")
 
 
 class Config(BaseModel):
-    """Root configuration model."""
+    """Root configuration model.
+
+    Config and its sections are frozen; use model_copy(update=...) to derive
+    a modified config.
+    """
 
     profile: ProfileConfig = Field(default_factory=ProfileConfig)
     auth: AuthConfig
@@ -199,14 +246,16 @@ class Config(BaseModel):
     storage: StorageConfig = Field(default_factory=StorageConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True, "defer_build": True}
 
-    def to_sdk_config(self) -> SDKConfiguration:
+    def to_sdk_config(self) -> "SDKConfiguration":
         """Convert CLI config to SDK config.
 
         Returns:
             SDKConfig instance
         """
+        from arize import Region, SDKConfiguration
+
         region = (
             Region(self.routing.region) if self.routing.region else Region.UNSET
         )
@@ -238,3 +287,15 @@ class Config(BaseModel):
             ),
             request_verify=bool(self.security.request_verify),
         )
+
+    def to_sdk_kwargs(self) -> dict[str, Any]:
+        """Convert CLI config to keyword arguments for ArizeClient.
+
+        Unlike dataclasses.asdict, this copies the SDK config fields shallowly
+        instead of recursively deep-copying nested values.
+
+        Returns:
+            Dictionary of SDK configuration fields
+        """
+        sdk_config = self.to_sdk_config()
+        return {f.name: getattr(sdk_config, f.name) for f in fields(sdk_config)}
@@ -1,8 +1,8 @@
 import os
+from collections.abc import Mapping
 from enum import Enum
 
 import questionary
-from rich.console import Console
 
 from ax.config.input_readers import (
     read_api_key,
@@ -23,7 +23,9 @@ from ax.config.schema import (
     TransportConfig,
 )
 
-console = Console()
+# Section field names, used to pick out detected env vars per section
+_ROUTING_FIELDS = frozenset(RoutingConfig.model_fields)
+_TRANSPORT_FIELDS = frozenset(TransportConfig.model_fields)
 
 
 # Standard environment variable names for detection
@@ -47,6 +49,9 @@ ENV_VAR_MAPPING = {
     "request_verify": "ARIZE_REQUEST_VERIFY",
 }
 
+# Env var names from ENV_VAR_MAPPING, for detecting which ones are set
+_ENV_VAR_NAMES = frozenset(ENV_VAR_MAPPING.values())
+
 
 class SetupMode(Enum):
     """Configuration setup mode."""
@@ -117,16 +122,25 @@ def advanced_setup(profile: str) -> Config:
     )
 
 
-def detect_env_vars() -> dict[str, str]:
+def detect_env_vars(env: Mapping[str, str] | None = None) -> dict[str, str]:
     """Detect existing ARIZE_* environment variables.
 
+    Args:
+        env: Environment to inspect. Defaults to os.environ.
+
     Returns:
         Dict mapping field names to detected env var names
     """
+    if env is None:
+        env = os.environ
+    present = _ENV_VAR_NAMES & env.keys()
+    if not present:
+        return {}
+    # Keep ENV_VAR_MAPPING order, which is the order they are displayed in
     return {
         field: env_var
         for field, env_var in ENV_VAR_MAPPING.items()
-        if env_var in os.environ
+        if env_var in present
     }
 
 
@@ -155,24 +169,14 @@ def create_config_from_env_vars(
         # api_key is required - this shouldn't happen but handle gracefully
         raise ValueError("api_key must be present in detected env vars")
 
-    auth_config = AuthConfig(**auth_kwargs)
+    # Sections holding only "${VAR}" references skip validation: the field
+    # validators pass such references through unchanged. Routing stays
+    # validated since it enforces mutually exclusive strategies.
+    auth_config = AuthConfig.model_construct(**auth_kwargs)
 
     # Build RoutingConfig
     routing_kwargs = {}
-    routing_fields = {
-        "region",
-        "single_host",
-        "single_port",
-        "base_domain",
-        "api_host",
-        "api_scheme",
-        "otlp_host",
-        "otlp_scheme",
-        "flight_host",
-        "flight_port",
-        "flight_scheme",
-    }
-    for field in routing_fields:
+    for field in _ROUTING_FIELDS:
         if field in env_vars:
             routing_kwargs[field] = env_ref(env_vars[field])
 
@@ -180,24 +184,18 @@ def create_config_from_env_vars(
 
     # Build TransportConfig
     transport_kwargs = {}
-    transport_fields = {
-        "stream_max_workers",
-        "stream_max_queue_bound",
-        "pyarrow_max_chunksize",
-        "max_http_payload_size_mb",
-    }
-    for field in transport_fields:
+    for field in _TRANSPORT_FIELDS:
         if field in env_vars:
             transport_kwargs[field] = env_ref(env_vars[field])
 
-    transport_config = TransportConfig(**transport_kwargs)
+    transport_config = TransportConfig.model_construct(**transport_kwargs)
 
     # Build SecurityConfig
     security_kwargs = {}
     if "request_verify" in env_vars:
         security_kwargs["request_verify"] = env_ref(env_vars["request_verify"])
 
-    security_config = SecurityConfig(**security_kwargs)
+    security_config = SecurityConfig.model_construct(**security_kwargs)
 
     storage_config = StorageConfig()
     output_config = OutputConfig(
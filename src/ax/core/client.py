@@ -0,0 +1,88 @@
+"""Arize SDK client construction."""
+
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+from ax.config.manager import ConfigManager
+from ax.config.schema import Config
+
+if TYPE_CHECKING:
+    from arize import ArizeClient
+
+# Clients keyed by their SDK configuration, shared within the process
+_client_pool: dict[tuple[tuple[str, Hashable], ...], "ArizeClient"] = {}
+
+
+def get_client(profile: str = "") -> "ArizeClient":
+    """Get an ArizeClient for a profile.
+
+    Clients are pooled per process by their SDK configuration, so commands
+    that run in the same process with the same settings share one client
+    (and its connections), while an edited profile gets a fresh client.
+
+    Args:
+        profile: Profile name. If empty, uses active profile or default.
+
+    Returns:
+        ArizeClient configured from the profile
+
+    Raises:
+        ConfigError: If config file doesn't exist or is invalid
+    """
+    config = ConfigManager.load(profile, expand_env_vars=True)
+    sdk_kwargs = config.to_sdk_kwargs()
+    key = _pool_key(sdk_kwargs)
+
+    client = _client_pool.get(key)
+    if client is None:
+        client = _client_pool[key] = _build_client(sdk_kwargs)
+    return client
+
+
+def build_client(config: Config) -> "ArizeClient":
+    """Build a new ArizeClient from a CLI config, bypassing the pool.
+
+    Args:
+        config: CLI configuration
+
+    Returns:
+        ArizeClient configured from config
+    """
+    return _build_client(config.to_sdk_kwargs())
+
+
+def _build_client(sdk_kwargs: dict[str, Any]) -> "ArizeClient":
+    """Build a new ArizeClient from SDK keyword arguments.
+
+    Args:
+        sdk_kwargs: Keyword arguments for ArizeClient
+
+    Returns:
+        ArizeClient configured from sdk_kwargs
+    """
+    from arize import ArizeClient
+
+    return ArizeClient(**sdk_kwargs)
+
+
+def clear_client_pool() -> None:
+    """Drop all pooled clients."""
+    _client_pool.clear()
+
+
+def _pool_key(sdk_kwargs: dict[str, Any]) -> tuple[tuple[str, Hashable], ...]:
+    """Build a hashable pool key from SDK keyword arguments.
+
+    Args:
+        sdk_kwargs: Keyword arguments for ArizeClient
+
+    Returns:
+        Tuple of (name, value) pairs, with dict values frozen
+    """
+    return tuple(
+        (
+            name,
+            tuple(sorted(value.items())) if isinstance(value, dict) else value,
+        )
+        for name, value in sdk_kwargs.items()
+    )
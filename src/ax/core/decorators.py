@@ -1,12 +1,10 @@
 """Common decorators for CLI commands."""
 
 import functools
-import sys
 from collections.abc import Callable
 from typing import ParamSpec, TypeVar
 
 import typer
-from rich.console import Console
 
 from ax.core.error_formatter import (
     format_error_message,
@@ -16,9 +14,7 @@ from ax.core.error_formatter import (
 from ax.core.exceptions import (
     AxError,
 )
-from ax.utils.console import error, new_line, warning
-
-console = Console()
+from ax.utils.console import console, error, new_line, warning
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -35,6 +31,10 @@ def handle_errors(f: Callable[P, R]) -> Callable[P, R]:
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         try:
             return f(*args, **kwargs)
+        except typer.Exit:
+            # Let Typer handle its own exits (checked first, as commands
+            # exit this way routinely)
+            raise
         except AxError as e:
             # Custom ax errors with exit codes
             # These errors are caught by the CLI and not unexpected, such as API
@@ -55,16 +55,13 @@ def handle_errors(f: Callable[P, R]) -> Callable[P, R]:
                 error(str(e))
 
             raise typer.Exit(code=e.exit_code) from e
-        except typer.Exit:
-            # Let Typer handle its own exits
-            raise
         except KeyboardInterrupt:
             new_line()
             warning("Operation cancelled by user")
             raise typer.Exit(code=130) from None
         except Exception as e:
             # Unexpected errors
-            if "--verbose" in sys.argv or "-v" in sys.argv:
+            if is_verbose_mode():
                 console.print_exception()
             else:
                 console.print(f"[red]✗ Unexpected error: {e}[/red]")
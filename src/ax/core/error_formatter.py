@@ -7,34 +7,63 @@ information from RFC 9457 Problem Details and provides helpful suggestions.
 
 import re
 import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
-
-from arize._generated.api_client.exceptions import ApiException
-from arize._generated.api_client.models.problem import Problem
-
-# Map gRPC codes to HTTP status
-grpc_to_http = {
-    0: (200, "OK"),  # OK
-    1: (499, "Client Closed Request"),  # CANCELLED (used by proxies)
-    2: (500, "Internal Server Error"),  # UNKNOWN
-    3: (400, "Invalid Argument"),  # INVALID_ARGUMENT
-    4: (504, "Gateway Timeout"),  # DEADLINE_EXCEEDED
-    5: (404, "Not Found"),  # NOT_FOUND
-    6: (409, "Conflict"),  # ALREADY_EXISTS
-    7: (403, "Permission Denied"),  # PERMISSION_DENIED
-    8: (429, "Too Many Requests"),  # RESOURCE_EXHAUSTED
-    9: (412, "Failed Precondition"),  # FAILED_PRECONDITION
-    10: (409, "Conflict"),  # ABORTED
-    11: (400, "Out of Range"),  # OUT_OF_RANGE
-    12: (501, "Not Implemented"),  # UNIMPLEMENTED
-    13: (500, "Internal Server Error"),  # INTERNAL
-    14: (503, "Service Unavailable"),  # UNAVAILABLE
-    15: (500, "Internal Server Error"),  # DATA_LOSS
-    16: (401, "Unauthenticated"),  # UNAUTHENTICATED
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from arize._generated.api_client.exceptions import ApiException
+
+# Map gRPC codes to HTTP status, indexed by gRPC code (codes are contiguous)
+_GRPC_TO_HTTP: tuple[tuple[int, str], ...] = (
+    (200, "OK"),  # 0 OK
+    (499, "Client Closed Request"),  # 1 CANCELLED (used by proxies)
+    (500, "Internal Server Error"),  # 2 UNKNOWN
+    (400, "Invalid Argument"),  # 3 INVALID_ARGUMENT
+    (504, "Gateway Timeout"),  # 4 DEADLINE_EXCEEDED
+    (404, "Not Found"),  # 5 NOT_FOUND
+    (409, "Conflict"),  # 6 ALREADY_EXISTS
+    (403, "Permission Denied"),  # 7 PERMISSION_DENIED
+    (429, "Too Many Requests"),  # 8 RESOURCE_EXHAUSTED
+    (412, "Failed Precondition"),  # 9 FAILED_PRECONDITION
+    (409, "Conflict"),  # 10 ABORTED
+    (400, "Out of Range"),  # 11 OUT_OF_RANGE
+    (501, "Not Implemented"),  # 12 UNIMPLEMENTED
+    (500, "Internal Server Error"),  # 13 INTERNAL
+    (503, "Service Unavailable"),  # 14 UNAVAILABLE
+    (500, "Internal Server Error"),  # 15 DATA_LOSS
+    (401, "Unauthenticated"),  # 16 UNAUTHENTICATED
+)
+
+# Patterns for flight client RuntimeError messages with gRPC debug context.
+# Each is searched over the full text, so one match can't hide another.
+_RE_WITH_MESSAGE = re.compile(r"with message:\s*([^.]+)\.?\s*gRPC")
+_RE_GRPC_MESSAGE = re.compile(r'grpc_message:"([^"]+)"')
+_RE_GRPC_STATUS = re.compile(r"grpc_status:(\d+)")
+
+
+# Suggestions for common HTTP status codes
+_SUGGESTIONS: dict[int, str] = {
+    400: "Check your input parameters and try again.",
+    401: "Authentication failed. Run 'ax config init' to configure credentials.",
+    403: "You don't have permission. Check your API key or space access.",
+    404: "Resource not found. Verify the ID exists using the list command.",
+    409: "Resource already exists. Choose a different name or use the list command.",
+    422: "Validation failed. Check the error details for specific field issues.",
+    429: "Rate limit exceeded. Wait a moment and try again.",
+    500: "Server error. Try again later or contact support if the issue persists.",
+    502: "Bad gateway. The server is temporarily unavailable. Try again later.",
+    503: "Service unavailable. The server is temporarily down. Try again later.",
+    504: "Gateway timeout. The server took too long to respond. Try again later.",
 }
 
+# Response headers always shown in verbose mode (besides any x-* header)
+_RELEVANT_HEADERS = frozenset(
+    {"content-type", "x-request-id", "x-trace-id", "retry-after"}
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedError:
     """Structured error information extracted from an ApiException."""
 
@@ -44,7 +73,7 @@ class ParsedError:
     detail: str | None = None
     instance: str | None = None
     reason: str | None = None
-    headers: dict | None = None
+    headers: Mapping[str, str] | None = None
     body: str | None = None
 
 
@@ -60,38 +89,18 @@ def parse_api_exception(exception: Exception) -> ParsedError | None:
     Returns:
         ParsedError with extracted information, or None if no ApiException found
     """
+    api_exception_type = _api_exception_type()
+    if api_exception_type is None:
+        return None
+
     # Walk the exception chain to find ApiException
     current: BaseException | None = exception
-    api_exception = None
-
     while current is not None:
-        if isinstance(current, ApiException):
-            api_exception = current
-            break
+        if isinstance(current, api_exception_type):
+            return _parse_api_error(current)
         current = getattr(current, "__cause__", None)
 
-    if api_exception is None:
-        return None
-
-    # Extract basic information
-    parsed = ParsedError(
-        status=api_exception.status,
-        reason=api_exception.reason,
-        headers=dict(api_exception.headers) if api_exception.headers else None,
-        body=api_exception.body,
-    )
-
-    # Extract Problem model data if available
-    if hasattr(api_exception, "data") and isinstance(
-        api_exception.data, Problem
-    ):
-        problem = api_exception.data
-        parsed.title = problem.title
-        parsed.detail = problem.detail
-        parsed.type = problem.type
-        parsed.instance = problem.instance
-
-    return parsed
+    return None
 
 
 def parse_grpc_error(exception: Exception) -> ParsedError | None:
@@ -112,38 +121,9 @@ def parse_grpc_error(exception: Exception) -> ParsedError | None:
     current: BaseException | None = exception
     while current is not None:
         if isinstance(current, RuntimeError):
-            error_text = str(current)
-
-            # Extract message using regex
-            # Pattern: 'with message: "actual message"' or 'grpc_message:"message"'
-            message_match = re.search(
-                r"with message:\s*([^.]+)\.?\s*gRPC", error_text
-            )
-            if not message_match:
-                message_match = re.search(r'grpc_message:"([^"]+)"', error_text)
-
-            if message_match:
-                user_message = message_match.group(1).strip()
-
-                # Map gRPC status code to HTTP equivalent
-                grpc_status = -1  # Default to -1 if not found, which will map to 500 Server Error
-                status_match = re.search(r"grpc_status:(\d+)", error_text)
-                if status_match:
-                    grpc_status = int(status_match.group(1))
-
-                http_status, reason = grpc_to_http.get(
-                    grpc_status, (500, "Server Error")
-                )
-
-                return ParsedError(
-                    status=http_status,
-                    reason=reason,
-                    detail=user_message,
-                    body=error_text
-                    if len(error_text) < 500
-                    else error_text[:500] + "...",
-                )
-
+            parsed = _parse_grpc_text(str(current))
+            if parsed:
+                return parsed
         current = getattr(current, "__cause__", None)
 
     return None
@@ -152,7 +132,8 @@ def parse_grpc_error(exception: Exception) -> ParsedError | None:
 def parse_exception(exception: Exception) -> ParsedError | None:
     """Parse any exception to extract structured error information.
 
-    Tries ApiException parsing first, then gRPC/Flight error parsing.
+    Walks the exception chain once. An ApiException anywhere in the chain
+    takes precedence; otherwise the first parseable gRPC/Flight error is used.
 
     Args:
         exception: The exception to parse
@@ -160,17 +141,107 @@ def parse_exception(exception: Exception) -> ParsedError | None:
     Returns:
         ParsedError with extracted information, or None if parsing failed
     """
-    # Try ApiException first
-    parsed = parse_api_exception(exception)
-    if parsed:
-        return parsed
+    api_exception_type = _api_exception_type()
+    grpc_error: ParsedError | None = None
 
-    # Try gRPC/Flight error parsing
-    parsed = parse_grpc_error(exception)
-    if parsed:
-        return parsed
+    current: BaseException | None = exception
+    while current is not None:
+        if api_exception_type is not None and isinstance(
+            current, api_exception_type
+        ):
+            return _parse_api_error(current)
+        if grpc_error is None and isinstance(current, RuntimeError):
+            grpc_error = _parse_grpc_text(str(current))
+        current = getattr(current, "__cause__", None)
 
-    return None
+    return grpc_error
+
+
+def _api_exception_type() -> "type[ApiException] | None":
+    """Get the SDK's ApiException class, if the SDK has been loaded.
+
+    Returns:
+        ApiException class, or None if the arize SDK isn't imported yet
+    """
+    # An ApiException can only have been raised once the SDK is loaded, so
+    # errors raised before that (e.g. config errors) don't pay for importing it
+    if "arize" not in sys.modules:
+        return None
+
+    from arize._generated.api_client.exceptions import ApiException
+
+    return ApiException
+
+
+def _parse_api_error(api_exception: "ApiException") -> ParsedError:
+    """Extract structured error information from an ApiException.
+
+    Args:
+        api_exception: The SDK ApiException
+
+    Returns:
+        ParsedError with status, reason and Problem model data if available
+    """
+    from arize._generated.api_client.models.problem import Problem
+
+    # Extract basic information
+    parsed = ParsedError(
+        status=api_exception.status,
+        reason=api_exception.reason,
+        # Only read by the verbose formatter, so the headers are not copied
+        headers=api_exception.headers or None,
+        body=api_exception.body,
+    )
+
+    # Extract Problem model data if available
+    if hasattr(api_exception, "data") and isinstance(
+        api_exception.data, Problem
+    ):
+        problem = api_exception.data
+        parsed.title = problem.title
+        parsed.detail = problem.detail
+        parsed.type = problem.type
+        parsed.instance = problem.instance
+
+    return parsed
+
+
+def _parse_grpc_text(error_text: str) -> ParsedError | None:
+    """Extract structured error information from gRPC debug text.
+
+    Args:
+        error_text: Message of a flight client RuntimeError
+
+    Returns:
+        ParsedError with extracted information, or None if no message found
+    """
+    # 'with message: ...' takes precedence over 'grpc_message:"..."'
+    message_match = _RE_WITH_MESSAGE.search(error_text)
+    if not message_match:
+        message_match = _RE_GRPC_MESSAGE.search(error_text)
+    if not message_match:
+        return None
+    message = message_match.group(1)
+
+    # Map gRPC status code to HTTP equivalent
+    # Default to -1 if not found, which will map to 500 Server Error
+    grpc_status = -1
+    status_match = _RE_GRPC_STATUS.search(error_text)
+    if status_match:
+        grpc_status = int(status_match.group(1))
+
+    http_status, reason = (
+        _GRPC_TO_HTTP[grpc_status]
+        if 0 <= grpc_status < len(_GRPC_TO_HTTP)
+        else (500, "Server Error")
+    )
+
+    return ParsedError(
+        status=http_status,
+        reason=reason,
+        detail=message.strip(),
+        body=error_text if len(error_text) < 500 else error_text[:500] + "...",
+    )
 
 
 def get_error_suggestion(status: int) -> str:
@@ -180,23 +251,9 @@ def get_error_suggestion(status: int) -> str:
         status: HTTP status code
 
     Returns:
-        Suggestion string, or None if no specific suggestion available
+        Suggestion string, or "" if no specific suggestion available
     """
-    suggestions = {
-        400: "Check your input parameters and try again.",
-        401: "Authentication failed. Run 'ax config init' to configure credentials.",
-        403: "You don't have permission. Check your API key or space access.",
-        404: "Resource not found. Verify the ID exists using the list command.",
-        409: "Resource already exists. Choose a different name or use the list command.",
-        422: "Validation failed. Check the error details for specific field issues.",
-        429: "Rate limit exceeded. Wait a moment and try again.",
-        500: "Server error. Try again later or contact support if the issue persists.",
-        502: "Bad gateway. The server is temporarily unavailable. Try again later.",
-        503: "Service unavailable. The server is temporarily down. Try again later.",
-        504: "Gateway timeout. The server took too long to respond. Try again later.",
-    }
-
-    return suggestions.get(status, "")
+    return _SUGGESTIONS.get(status, "")
 
 
 def format_error_message(
@@ -272,16 +329,10 @@ def _format_verbose_error(error: ParsedError) -> str:
     if error.headers:
         lines.append("")
         lines.append("[bold]Response Headers:[/bold]")
-        # Show relevant headers (filter out verbose ones)
-        relevant_headers = [
-            "content-type",
-            "x-request-id",
-            "x-trace-id",
-            "retry-after",
-        ]
         for key, value in error.headers.items():
             # Show all headers that start with x- or are in relevant list
-            if key.lower() in relevant_headers or key.lower().startswith("x-"):
+            lower_key = key.lower()
+            if lower_key in _RELEVANT_HEADERS or lower_key.startswith("x-"):
                 lines.append(f"  {key}: {value}")
 
     # Raw Response Body section
@@ -293,7 +344,7 @@ def _format_verbose_error(error: ParsedError) -> str:
         if len(body) > 1000:
             body = body[:1000] + "... (truncated)"
         # Indent body lines
-        lines.extend(f"  {line}" for line in body.split("\n"))
+        lines.append("  " + body.replace("\n", "\n  "))
 
     # Add suggestion at the end in verbose mode too
     status = error.status if error.status else 0
@@ -0,0 +1,34 @@
+"""Shared command-line option types for CLI commands."""
+
+from typing import Annotated
+
+import typer
+
+ProfileOption = Annotated[
+    str,
+    typer.Option(
+        "--profile",
+        "-p",
+        help="Configuration profile to use",
+    ),
+]
+
+OutputOption = Annotated[
+    str,
+    typer.Option(
+        "--output",
+        "-o",
+        help="Output format (table, json, csv, parquet) or file path",
+    ),
+]
+
+# Accepted on every command so `ax <group> <command> -v` works; error
+# handling reads the flag from sys.argv rather than from the parameter
+VerboseOption = Annotated[
+    bool,
+    typer.Option(
+        "--verbose",
+        "-v",
+        help="Enable verbose logs",
+    ),
+]
@@ -1,14 +1,14 @@
 """Output formatters for different formats (table, json, csv, parquet)."""
 
-import json
+import csv
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
-import pandas as pd
 from pydantic import BaseModel
-from rich.console import Console
+from rich.console import Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 
@@ -19,9 +19,11 @@ from ax.core.pydantic import (
     flatten_basemodel_for_export,
     is_list_response_model,
 )
-from ax.utils.console import new_line, text, text_dimmed
+from ax.utils.console import console, text
+from ax.utils.file_io import PARQUET_WRITE_OPTIONS, write_parquet
 
-console = Console()
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class BaseModelTableFormatter:
@@ -34,54 +36,68 @@ class BaseModelTableFormatter:
             model: Pydantic BaseModel instance to format
         """
         metadata, list_fields = categorize_basemodel_fields(model)
+        # Collected and printed at once, so the output is rendered in one pass
+        renderables: list[RenderableType] = []
 
         # Render metadata panel if there are scalar fields
         if metadata:
-            self._render_metadata_panel(model, metadata)
+            renderables.append(self._render_metadata_panel(model, metadata))
 
         # Render each list field as a separate table
         for field_name, items in list_fields.items():
             if metadata:  # Add spacing if we rendered a panel
-                new_line()
-            self._render_list_field_table(field_name, items)
+                renderables.append("")
+            table = self._render_list_field_table(field_name, items)
+            if table is not None:
+                renderables.append(table)
+
+        if renderables:
+            console.print(Group(*renderables))
 
     def _render_metadata_panel(
         self, model: BaseModel, metadata: dict[str, Any]
-    ) -> None:
+    ) -> Panel:
         """Render scalar fields as a Rich Panel.
 
         Args:
             model: BaseModel instance (for class name)
             metadata: Dictionary of scalar field values
+
+        Returns:
+            Panel listing the scalar fields
         """
         lines = []
         for key, value in metadata.items():
             formatted_value = self._format_value(value)
             lines.append(f"[bold cyan]{key}:[/bold cyan] {formatted_value}")
 
-        panel = Panel(
+        return Panel(
             "\n".join(lines),
             title=f"[bold]{model.__class__.__name__} Details[/bold]",
             border_style="cyan",
             padding=(1, 2),
         )
-        console.print(panel)
 
-    def _render_list_field_table(self, field_name: str, items: list) -> None:
+    def _render_list_field_table(
+        self, field_name: str, items: list
+    ) -> Table | None:
         """Render a list field as a Rich Table.
 
         Args:
             field_name: Name of the field
             items: List of items (BaseModel or dict objects)
+
+        Returns:
+            Table of the items, or None if there is nothing to show
         """
         if not items:
-            return
+            return None
 
         # Convert to DataFrame
         df = basemodel_to_dataframe(items)
 
         if df.empty:
-            return
+            return None
 
         # Create Rich table with title showing count
         table = Table(
@@ -94,12 +110,40 @@ class BaseModelTableFormatter:
         for col in df.columns:
             table.add_column(str(col))
 
-        # Add rows with formatted values
-        for _, row in df.iterrows():
-            formatted_row = [self._format_value(val) for val in row]
-            table.add_row(*formatted_row)
+        # Format column by column, then add the rows
+        columns = [self._format_column(df[col]) for col in df.columns]
+        for row in zip(*columns, strict=True):
+            table.add_row(*row)
+
+        return table
+
+    def _format_column(self, series: "pd.Series") -> list[str]:
+        """Format a DataFrame column for display in a table.
 
-        console.print(table)
+        Bool and datetime columns are formatted with vectorized operations;
+        other columns fall back to formatting each value.
+
+        Args:
+            series: Column to format
+
+        Returns:
+            Formatted strings, one per row
+        """
+        import pandas as pd
+
+        if pd.api.types.is_bool_dtype(series):
+            return series.map(
+                {True: "[green]True[/green]", False: "[red]False[/red]"}
+            ).tolist()
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return (
+                series.dt.strftime("%Y-%m-%d %H:%M:%S")
+                .fillna("[dim]None[/dim]")
+                .tolist()
+            )
+        if pd.api.types.is_numeric_dtype(series):
+            return [str(value) for value in series.tolist()]
+        return [self._format_value(value) for value in series.tolist()]
 
     def _format_value(self, value: object) -> str:
         """Format a value for display in table or panel.
@@ -115,7 +159,11 @@ class BaseModelTableFormatter:
         if isinstance(value, bool):
             return "[green]True[/green]" if value else "[red]False[/red]"
         if isinstance(value, datetime):
-            return value.strftime("%Y-%m-%d %H:%M:%S")
+            # Same as strftime("%Y-%m-%d %H:%M:%S"), without the locale path
+            return (
+                f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+                f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+            )
         if isinstance(value, list):
             # Empty list or list of scalars
             return f"[dim]{len(value)} items[/dim]" if value else "[dim][]"
@@ -134,7 +182,7 @@ class OutputFormatter(ABC):
             output_file: Optional file path to write to. If None, writes to stdout.
         """
 
-    def _to_dataframe(self, data: BaseModel) -> pd.DataFrame:
+    def _to_dataframe(self, data: BaseModel) -> "pd.DataFrame":
         """Convert various data types to DataFrame."""
         # Handle list responses - extract items only (no pagination in files)
         if is_list_response_model(data):
@@ -147,6 +195,8 @@ class OutputFormatter(ABC):
             )
 
         # Handle single BaseModel - flatten for export
+        import pandas as pd
+
         flattened = flatten_basemodel_for_export(data)
         return pd.DataFrame([flattened])
 
@@ -164,17 +214,19 @@ class TableFormatter(OutputFormatter):
         # Special handling for list responses - show items + pagination
         if is_list_response_model(data):
             df = self._to_dataframe(data)
+            # Items and pagination info are printed together in one pass
+            renderables: list[RenderableType] = []
             # Show items as table
             if len(df) > 0:
                 # Render table
                 table = Table(show_header=True, header_style="bold cyan")
                 for col in df.columns:
                     table.add_column(str(col))
-                for _, row in df.iterrows():
+                for row in df.itertuples(index=False, name=None):
                     table.add_row(*[str(val) for val in row])
-                console.print(table)
+                renderables.append(table)
             else:
-                text_dimmed("No items to display")
+                renderables.append("[dim]No items to display[/dim]")
 
             # Show pagination info below
             if data.pagination.has_more:  # type: ignore
@@ -186,8 +238,9 @@ class TableFormatter(OutputFormatter):
                         " Pagination cursor not supported for this command, "
                         "it will be available in a future release."
                     )
-                new_line()
-                text_dimmed(msg)
+                renderables.extend(("", f"[dim]{msg}[/dim]"))
+
+            console.print(Group(*renderables))
             return
 
         # Special handling for BaseModel - use BaseModelTableFormatter
@@ -202,12 +255,12 @@ class JSONFormatter(OutputFormatter):
 
     def format(self, data: BaseModel, output_file: str = "") -> None:
         """Format data as JSON."""
-        output = data.model_dump(mode="json", exclude_none=True)
-        json_str = json.dumps(output, indent=2, default=str)
+        # Serialized directly by pydantic-core, without an intermediate dict
+        json_str = data.model_dump_json(exclude_none=True, indent=2)
 
         if output_file:
             try:
-                Path(output_file).write_text(json_str)
+                Path(output_file).write_bytes(json_str.encode())
             except Exception as e:
                 raise FileIOError(f"Failed to write JSON file: {e}") from e
         else:
@@ -219,6 +272,11 @@ class CSVFormatter(OutputFormatter):
 
     def format(self, data: BaseModel, output_file: str = "") -> None:
         """Format data as CSV."""
+        # A single model is one row; write it without building a DataFrame
+        if not is_list_response_model(data):
+            self._write_row(flatten_basemodel_for_export(data), output_file)
+            return
+
         df = self._to_dataframe(data)
 
         if output_file:
@@ -227,9 +285,35 @@ class CSVFormatter(OutputFormatter):
             except Exception as e:
                 raise FileIOError(f"Failed to write CSV file: {e}") from e
         else:
-            # Output to stdout
-            csv_str = df.to_csv(index=False)
-            text(csv_str)
+            # Stream to stdout, bypassing Rich's markup parsing and wrapping
+            df.to_csv(sys.stdout, index=False)
+            sys.stdout.flush()
+
+    def _write_row(self, row: dict[str, Any], output_file: str) -> None:
+        """Write a single flattened record as a CSV header and row.
+
+        Args:
+            row: Flattened record
+            output_file: File path to write to, or "" for stdout
+        """
+        if not output_file:
+            self._write_csv_rows(sys.stdout, row)
+            sys.stdout.flush()
+            return
+
+        try:
+            with Path(output_file).open("w", newline="") as f:
+                self._write_csv_rows(f, row)
+        except Exception as e:
+            raise FileIOError(f"Failed to write CSV file: {e}") from e
+
+    @staticmethod
+    def _write_csv_rows(f: TextIO, row: dict[str, Any]) -> None:
+        """Write the header and values of a record with the csv module."""
+        # Match DataFrame.to_csv's line endings
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(row.keys())
+        writer.writerow(row.values())
 
 
 class ParquetFormatter(OutputFormatter):
@@ -243,14 +327,30 @@ class ParquetFormatter(OutputFormatter):
                 "Use --output to specify a file path."
             )
 
-        df = self._to_dataframe(data)
-
         try:
-            df.to_parquet(output_file, index=False)
+            if is_list_response_model(data):
+                write_parquet(self._to_dataframe(data), output_file)
+            else:
+                # A single model is one row; build the Arrow table directly
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                row = flatten_basemodel_for_export(data)
+                table = pa.Table.from_pydict({k: [v] for k, v in row.items()})
+                pq.write_table(table, output_file, **PARQUET_WRITE_OPTIONS)
         except Exception as e:
             raise FileIOError(f"Failed to write Parquet file: {e}") from e
 
 
+# Formatters hold no state, so one shared instance per format is enough
+_FORMATTERS: dict[str, OutputFormatter] = {
+    "table": TableFormatter(),
+    "json": JSONFormatter(),
+    "csv": CSVFormatter(),
+    "parquet": ParquetFormatter(),
+}
+
+
 def get_formatter(format_type: str) -> OutputFormatter:
     """Factory function to get formatter by type.
 
@@ -263,21 +363,14 @@ def get_formatter(format_type: str) -> OutputFormatter:
     Raises:
         ValueError: If format_type is not supported
     """
-    formatters: dict[str, type[OutputFormatter]] = {
-        "table": TableFormatter,
-        "json": JSONFormatter,
-        "csv": CSVFormatter,
-        "parquet": ParquetFormatter,
-    }
-
-    formatter_class = formatters.get(format_type.lower())
-    if not formatter_class:
+    formatter = _FORMATTERS.get(format_type.lower())
+    if not formatter:
         raise ValueError(
             f"Unsupported format: {format_type}. "
-            f"Supported formats: {', '.join(formatters.keys())}"
+            f"Supported formats: {', '.join(_FORMATTERS.keys())}"
         )
 
-    return formatter_class()
+    return formatter
 
 
 def output_data(
@@ -1,13 +1,19 @@
 """Utilities for inspecting and converting Pydantic BaseModel objects."""
 
-from typing import Any
+from functools import cache
+from types import UnionType
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
 
-import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def is_list_of_structured_data(value: object) -> bool:
-    """Check if value is a non-empty list of BaseModel or dict objects.
+    """Check if value is a non-empty list of non-empty dicts.
+
+    Values come from model_dump(), where nested models are already dicts.
 
     Args:
         value: Value to check
@@ -15,14 +21,13 @@ def is_list_of_structured_data(value: object) -> bool:
     Returns:
         True if value is a non-empty list of structured objects
     """
-    if not isinstance(value, list) or len(value) == 0:
-        return False
-
-    # Check if first item is structured data (BaseModel or dict with multiple keys)
-    first_item = value[0]
-    if isinstance(first_item, BaseModel):
-        return True
-    return isinstance(first_item, dict) and len(first_item) > 0
+    # Only the first item is checked
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and isinstance(value[0], dict)
+        and len(value[0]) > 0
+    )
 
 
 def categorize_basemodel_fields(
@@ -30,6 +35,9 @@ def categorize_basemodel_fields(
 ) -> tuple[dict[str, Any], dict[str, list]]:
     """Split BaseModel fields into metadata (scalars) and list_fields (structured lists).
 
+    Declared fields whose annotation rules out a list are sent straight to
+    metadata (decided once per class); all other values are inspected.
+
     Args:
         model: Pydantic BaseModel instance
 
@@ -41,8 +49,11 @@ def categorize_basemodel_fields(
     metadata: dict[str, Any] = {}
     list_fields: dict[str, list] = {}
 
+    non_list_fields = _non_list_fields(type(model))
     for field_name, value in model.model_dump().items():
-        if is_list_of_structured_data(value):
+        if field_name not in non_list_fields and is_list_of_structured_data(
+            value
+        ):
             list_fields[field_name] = value
         else:
             # Scalars, None, or empty lists go to metadata
@@ -51,7 +62,55 @@ def categorize_basemodel_fields(
     return metadata, list_fields
 
 
-def basemodel_to_dataframe(models: list[BaseModel | dict]) -> pd.DataFrame:
+@cache
+def _non_list_fields(model_type: type[BaseModel]) -> frozenset[str]:
+    """Find the fields of a BaseModel class that can never dump to a list.
+
+    Args:
+        model_type: Pydantic BaseModel class
+
+    Returns:
+        Names of fields whose annotation excludes list values
+    """
+    return frozenset(
+        name
+        for name, field in model_type.model_fields.items()
+        if _excludes_list(field.annotation)
+    )
+
+
+def _excludes_list(annotation: object) -> bool:
+    """Check if a field annotation rules out list values.
+
+    Unions match only if every member rules out lists. Any, object,
+    abstract collections, type variables and root models do not match,
+    since their values may still be lists.
+
+    Args:
+        annotation: Field annotation from model_fields
+
+    Returns:
+        True if values of the field never dump to a list
+    """
+    if annotation is None or annotation is type(None):
+        return True
+    if annotation is Any:
+        return False
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return all(_excludes_list(arg) for arg in get_args(annotation))
+    if origin is Literal:
+        return True
+    cls = origin or annotation
+    return (
+        isinstance(cls, type)
+        and not issubclass(cls, list)
+        and not issubclass(list, cls)
+        and not issubclass(cls, RootModel)
+    )
+
+
+def basemodel_to_dataframe(models: list[BaseModel | dict]) -> "pd.DataFrame":
     """Convert a list of BaseModel instances or dicts to a DataFrame.
 
     Args:
@@ -60,6 +119,8 @@ def basemodel_to_dataframe(models: list[BaseModel | dict]) -> pd.DataFrame:
     Returns:
         DataFrame with flattened data
     """
+    import pandas as pd
+
     if not models:
         return pd.DataFrame()
 
@@ -110,4 +171,17 @@ def is_list_response_model(model: BaseModel) -> bool:
     Returns:
         True if model has pagination field (is a list response)
     """
-    return hasattr(model, "pagination")
+    return _is_list_response_type(type(model))
+
+
+@cache
+def _is_list_response_type(model_type: type[BaseModel]) -> bool:
+    """Check if a BaseModel class declares a pagination field.
+
+    Args:
+        model_type: Pydantic BaseModel class
+
+    Returns:
+        True if the class has a pagination field
+    """
+    return "pagination" in model_type.model_fields
@@ -0,0 +1,34 @@
+"""Tests for configuration input readers module."""
+
+from unittest.mock import MagicMock, patch
+
+from ax.config.input_readers import AdvancedRoutingOpts, read_routing
+from ax.config.schema import RoutingConfig
+
+
+class TestReadRouting:
+    """Tests for read_routing function."""
+
+    @patch("ax.config.input_readers.questionary.select")
+    def test_no_override_returns_defaults(self, mock_select: MagicMock) -> None:
+        """Test the no-override option returns the default routing."""
+        mock_select.return_value.ask.return_value = (
+            AdvancedRoutingOpts.NONE.value
+        )
+
+        assert read_routing() == RoutingConfig()
+
+    @patch("ax.config.input_readers.read_str_field")
+    @patch("ax.config.input_readers.questionary.select")
+    def test_base_domain_option(
+        self, mock_select: MagicMock, mock_read_str: MagicMock
+    ) -> None:
+        """Test the base domain option reads the domain."""
+        mock_select.return_value.ask.return_value = (
+            AdvancedRoutingOpts.BASE_DOMAIN.value
+        )
+        mock_read_str.return_value = "my.company.com"
+
+        routing = read_routing()
+        assert routing.base_domain == "my.company.com"
+        assert routing.region == ""
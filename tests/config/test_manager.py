@@ -1,7 +1,10 @@
 """Tests for configuration manager module."""
 
 import os
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,7 +17,13 @@ from ax.config.manager import (
     _to_float,
     _to_int,
 )
-from ax.config.schema import AuthConfig, Config, ProfileConfig, RoutingConfig
+from ax.config.schema import (
+    AuthConfig,
+    Config,
+    ProfileConfig,
+    RoutingConfig,
+    TransportConfig,
+)
 from ax.core.exceptions import ConfigError
 
 
@@ -40,6 +49,15 @@ class TestConfigManager:
         profiles = ConfigManager.list_profiles()
         assert sorted(profiles) == ["default", "dev", "prod"]
 
+    def test_list_profiles_ignores_directories(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test only .toml files are listed as profiles."""
+        (ConfigManager.PROFILES_DIR / "dev.toml").touch()
+        (ConfigManager.PROFILES_DIR / "backup.toml").mkdir()
+        (ConfigManager.PROFILES_DIR / "notes.txt").touch()
+        assert ConfigManager.list_profiles() == ["dev"]
+
     def test_exists_returns_false_for_missing(
         self, mock_config_dir: Path
     ) -> None:
@@ -60,6 +78,16 @@ class TestConfigManager:
         (ConfigManager.PROFILES_DIR / "prod.toml").touch()
         assert ConfigManager.exists("prod")
 
+    def test_list_profiles_after_delete(self, mock_config_dir: Path) -> None:
+        """Test list_profiles reflects profiles deleted by ConfigManager."""
+        (ConfigManager.PROFILES_DIR / "prod.toml").touch()
+        (ConfigManager.PROFILES_DIR / "staging.toml").touch()
+        assert ConfigManager.list_profiles() == ["prod", "staging"]
+
+        ConfigManager.delete_profile("staging")
+        assert ConfigManager.list_profiles() == ["prod"]
+        assert not ConfigManager.exists("staging")
+
     def test_get_active_profile_default_when_no_file(
         self, mock_config_dir: Path
     ) -> None:
@@ -143,6 +171,7 @@ class TestConfigManager:
         loaded_config = ConfigManager.load(profile="correct_name")
 
         assert loaded_config.profile.name == "correct_name"
+        assert config.profile.name == "wrong_name"
 
     def test_load_raises_for_missing_config(
         self, mock_config_dir: Path
@@ -162,9 +191,26 @@ class TestConfigManager:
         loaded_config = ConfigManager.load(profile="")
         assert loaded_config.auth.api_key == "ak-test123"
 
-    def test_load_expands_env_vars(self, mock_config_dir: Path) -> None:
+    def test_load_with_active(self, mock_config_dir: Path) -> None:
+        """Test load_with_active returns the config and active profile."""
+        config = Config(auth=AuthConfig(api_key="ak-test123"))
+        ConfigManager.save(config, profile="default")
+        ConfigManager.save(config, profile="dev")
+        ConfigManager.set_active_profile("dev")
+
+        loaded_config, active = ConfigManager.load_with_active(profile="")
+        assert loaded_config.profile.name == "dev"
+        assert active == "dev"
+
+        loaded_config, active = ConfigManager.load_with_active("default")
+        assert loaded_config.profile.name == "default"
+        assert active == "dev"
+
+    def test_load_expands_env_vars(
+        self, mock_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test load expands environment variables."""
-        os.environ["TEST_API_KEY"] = "ak-from-env"
+        monkeypatch.setenv("TEST_API_KEY", "ak-from-env")
 
         config = Config(auth=AuthConfig(api_key="${TEST_API_KEY}"))
         ConfigManager.save(config, profile="default")
@@ -172,8 +218,19 @@ class TestConfigManager:
         loaded_config = ConfigManager.load(profile="default")
         assert loaded_config.auth.api_key == "ak-from-env"
 
-        # Cleanup
-        del os.environ["TEST_API_KEY"]
+    def test_load_reexpands_when_env_var_changes(
+        self, mock_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a cached config is not reused after a referenced var changes."""
+        monkeypatch.setenv("TEST_API_KEY", "ak-first")
+        config = Config(auth=AuthConfig(api_key="${TEST_API_KEY}"))
+        ConfigManager.save(config, profile="default")
+        first = ConfigManager.load(profile="default")
+        assert first.auth.api_key == "ak-first"
+        assert ConfigManager.load(profile="default") is first
+
+        monkeypatch.setenv("TEST_API_KEY", "ak-second")
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-second"
 
     def test_load_without_env_var_expansion(
         self, mock_config_dir: Path
@@ -187,6 +244,110 @@ class TestConfigManager:
         )
         assert loaded_config.auth.api_key == "${TEST_API_KEY}"
 
+    def test_load_skips_expansion_without_references(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test configs without ${VAR} references are not walked."""
+        ConfigManager.save(
+            Config(auth=AuthConfig(api_key="ak-test123")), profile="default"
+        )
+
+        with patch("ax.config.manager._expand_config_dict") as expand:
+            loaded_config = ConfigManager.load(profile="default")
+
+        expand.assert_not_called()
+        assert loaded_config.auth.api_key == "ak-test123"
+
+    def test_load_keeps_transport_env_var_references(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test unexpanded env var references load into int transport fields."""
+        config = Config(
+            auth=AuthConfig(api_key="ak-test123"),
+            transport=TransportConfig(stream_max_workers="${TEST_WORKERS}"),
+        )
+        ConfigManager.save(config, profile="default")
+
+        loaded_config = ConfigManager.load(
+            profile="default", expand_env_vars=False
+        )
+        assert loaded_config.transport.stream_max_workers == "${TEST_WORKERS}"
+
+    def test_load_returns_cached_config(self, mock_config_dir: Path) -> None:
+        """Test repeated loads return the cached Config instance."""
+        config = Config(auth=AuthConfig(api_key="ak-test123"))
+        ConfigManager.save(config, profile="default")
+
+        first = ConfigManager.load(profile="default")
+        assert ConfigManager.load(profile="default") is first
+
+    def test_save_invalidates_load_cache(self, mock_config_dir: Path) -> None:
+        """Test save drops previously cached configs."""
+        ConfigManager.save(
+            Config(auth=AuthConfig(api_key="ak-old")), profile="default"
+        )
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-old"
+
+        ConfigManager.save(
+            Config(auth=AuthConfig(api_key="ak-new")), profile="default"
+        )
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-new"
+
+    def test_set_active_profile_invalidates_cache(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test set_active_profile replaces the cached active profile."""
+        (ConfigManager.PROFILES_DIR / "prod.toml").touch()
+        assert ConfigManager.get_active_profile() == "default"
+
+        ConfigManager.set_active_profile("prod")
+        assert ConfigManager.get_active_profile() == "prod"
+
+    def test_load_reloads_when_file_changes(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test load re-reads a config edited outside ConfigManager."""
+        ConfigManager.save(
+            Config(auth=AuthConfig(api_key="ak-old")), profile="default"
+        )
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-old"
+
+        config_file = ConfigManager.DEFAULT_CONFIG_FILE
+        config_file.write_text('[auth]\napi_key = "ak-new"\n')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-new"
+
+    def test_load_reloads_when_size_changes_with_same_mtime(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test load re-reads a same-tick rewrite that changes the file size."""
+        ConfigManager.save(
+            Config(auth=AuthConfig(api_key="ak-old")), profile="default"
+        )
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-old"
+
+        config_file = ConfigManager.DEFAULT_CONFIG_FILE
+        stat = config_file.stat()
+        config_file.write_text('[auth]\napi_key = "ak-longer"\n')
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-longer"
+
+    def test_get_active_profile_reloads_when_file_changes(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test get_active_profile re-reads an edited active profile file."""
+        ConfigManager.ACTIVE_PROFILE_FILE.write_text("default")
+        assert ConfigManager.get_active_profile() == "default"
+
+        ConfigManager.ACTIVE_PROFILE_FILE.write_text("prod")
+        stat = ConfigManager.ACTIVE_PROFILE_FILE.stat()
+        os.utime(
+            ConfigManager.ACTIVE_PROFILE_FILE,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1),
+        )
+        assert ConfigManager.get_active_profile() == "prod"
+
     def test_save_removes_empty_values(self, mock_config_dir: Path) -> None:
         """Test that save removes empty string values."""
         config = Config(
@@ -205,6 +366,54 @@ class TestConfigManager:
         # Empty string should not be present in saved file
         assert "region" not in data.get("routing", {})
 
+    def test_save_failure_keeps_existing_config(
+        self, mock_config_dir: Path
+    ) -> None:
+        """Test a failed save leaves the previous config file intact."""
+        ConfigManager.save(
+            Config(auth=AuthConfig(api_key="ak-old")), profile="default"
+        )
+        original = ConfigManager.DEFAULT_CONFIG_FILE.read_bytes()
+
+        with (
+            patch("ax.config.manager.os.replace", side_effect=OSError("boom")),
+            pytest.raises(ConfigError, match="Failed to save config"),
+        ):
+            ConfigManager.save(
+                Config(auth=AuthConfig(api_key="ak-new")), profile="default"
+            )
+
+        assert ConfigManager.DEFAULT_CONFIG_FILE.read_bytes() == original
+        assert sorted(p.name for p in mock_config_dir.iterdir()) == [
+            "config.toml",
+            "profiles",
+        ]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_save_preserves_file_mode(self, mock_config_dir: Path) -> None:
+        """Test save keeps the permissions of an existing config file."""
+        config_file = ConfigManager.DEFAULT_CONFIG_FILE
+        ConfigManager.save(Config(auth=AuthConfig(api_key="ak-old")))
+        assert config_file.stat().st_mode & 0o777 == 0o600
+
+        config_file.chmod(0o640)
+        ConfigManager.save(Config(auth=AuthConfig(api_key="ak-new")))
+
+        assert config_file.stat().st_mode & 0o777 == 0o640
+
+    def test_save_writes_through_symlink(
+        self, mock_config_dir: Path, tmp_path: Path
+    ) -> None:
+        """Test save updates the target of a symlinked config file."""
+        target = tmp_path / "shared.toml"
+        target.touch()
+        ConfigManager.DEFAULT_CONFIG_FILE.symlink_to(target)
+
+        ConfigManager.save(Config(auth=AuthConfig(api_key="ak-link")))
+
+        assert ConfigManager.DEFAULT_CONFIG_FILE.is_symlink()
+        assert ConfigManager.load(profile="default").auth.api_key == "ak-link"
+
     def test_get_config_path_default(self, mock_config_dir: Path) -> None:
         """Test _get_config_path returns correct path for default."""
         path = ConfigManager._get_config_path("default")
@@ -215,6 +424,14 @@ class TestConfigManager:
         path = ConfigManager._get_config_path("prod")
         assert path == ConfigManager.PROFILES_DIR / "prod.toml"
 
+    def test_import_does_not_load_toml_parser(self) -> None:
+        """Test the TOML parser is only imported when a config is loaded."""
+        code = (
+            "import sys, ax.config.manager; assert 'tomllib' not in sys.modules"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
 
 class TestHelperFunctions:
     """Tests for helper functions in manager module."""
@@ -308,12 +525,13 @@ class TestHelperFunctions:
         assert _remove_empty_values(42) == 42
         assert _remove_empty_values([1, 2, 3]) == [1, 2, 3]
 
-    def test_expand_env_var_simple(self) -> None:
+    def test_expand_env_var_simple(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test _expand_env_var expands simple variable."""
-        os.environ["TEST_VAR"] = "test_value"
+        monkeypatch.setenv("TEST_VAR", "test_value")
         result = _expand_env_var("${TEST_VAR}")
         assert result == "test_value"
-        del os.environ["TEST_VAR"]
 
     def test_expand_env_var_with_default(self) -> None:
         """Test _expand_env_var uses default when var not set."""
@@ -330,19 +548,19 @@ class TestHelperFunctions:
         result = _expand_env_var("literal_value")
         assert result == "literal_value"
 
-    def test_expand_env_var_multiple_vars(self) -> None:
+    def test_expand_env_var_multiple_vars(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test _expand_env_var expands multiple variables."""
-        os.environ["VAR1"] = "value1"
-        os.environ["VAR2"] = "value2"
+        monkeypatch.setenv("VAR1", "value1")
+        monkeypatch.setenv("VAR2", "value2")
         result = _expand_env_var("${VAR1}-${VAR2}")
         assert result == "value1-value2"
-        del os.environ["VAR1"]
-        del os.environ["VAR2"]
 
-    def test_expand_config_dict(self) -> None:
+    def test_expand_config_dict(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test _expand_config_dict expands variables in nested dict."""
-        os.environ["API_KEY"] = "ak-from-env"
-        os.environ["REGION"] = "US"
+        monkeypatch.setenv("API_KEY", "ak-from-env")
+        monkeypatch.setenv("REGION", "US")
 
         data = {
             "auth": {"api_key": "${API_KEY}"},
@@ -357,9 +575,6 @@ class TestHelperFunctions:
             "output": {"format": "table"},
         }
 
-        del os.environ["API_KEY"]
-        del os.environ["REGION"]
-
     def test_expand_config_dict_preserves_non_string_values(self) -> None:
         """Test _expand_config_dict preserves non-string values."""
         data = {
@@ -1,5 +1,6 @@
 """Tests for configuration schema module."""
 
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
@@ -208,6 +209,16 @@ class TestStorageConfig:
         assert isinstance(cache_dir, Path)
         assert str(cache_dir).endswith("cache")
 
+    def test_expanded_directory_follows_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that expansion uses HOME at access time, not at first use."""
+        storage = StorageConfig(directory="~/.arize")
+        _ = storage.cache_dir
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert storage.expanded_directory == tmp_path / ".arize"
+        assert storage.cache_dir == tmp_path / ".arize" / "cache"
+
     def test_custom_directory(self) -> None:
         """Test creating storage config with custom directory."""
         storage = StorageConfig(directory="/custom/path")
@@ -336,3 +347,32 @@ class TestConfig:
         sdk_config = config.to_sdk_config()
 
         assert sdk_config.region == Region.UNSET
+
+    def test_to_sdk_kwargs_matches_sdk_config(self) -> None:
+        """Test that to_sdk_kwargs mirrors the SDKConfiguration fields."""
+        config = Config(
+            auth=AuthConfig(api_key="ak-test123"),
+            routing=RoutingConfig(region="us-east-1b"),
+        )
+        kwargs = config.to_sdk_kwargs()
+
+        assert kwargs == asdict(config.to_sdk_config())
+        assert kwargs["api_key"] == "ak-test123"
+        assert kwargs["region"] == Region("us-east-1b")
+
+    def test_to_sdk_config_reflects_copies(self) -> None:
+        """Test a copied config with a new section converts to new values."""
+        config = Config(auth=AuthConfig(api_key="ak-test123"))
+        assert config.to_sdk_config().api_key == "ak-test123"
+
+        updated = config.model_copy(
+            update={"auth": AuthConfig(api_key="ak-other")}
+        )
+        assert updated.to_sdk_config().api_key == "ak-other"
+        assert config.to_sdk_config().api_key == "ak-test123"
+
+    def test_config_is_frozen(self) -> None:
+        """Test that config sections cannot be mutated in place."""
+        config = Config(auth=AuthConfig(api_key="ak-test123"))
+        with pytest.raises(ValidationError, match="frozen"):
+            config.auth.api_key = "ak-other"  # type: ignore[misc]
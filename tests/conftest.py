@@ -1,8 +1,8 @@
 """Shared pytest fixtures and configuration for all tests."""
 
-from collections.abc import Generator
+from collections.abc import Mapping
 from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
 
 import pytest
 
@@ -20,13 +20,14 @@ def temp_config_dir(tmp_path: Path) -> Path:
         Path to temporary .arize config directory
     """
     config_dir = tmp_path / ".arize"
-    config_dir.mkdir()
-    (config_dir / "profiles").mkdir()
+    (config_dir / "profiles").mkdir(parents=True)
     return config_dir
 
 
 @pytest.fixture
-def mock_config_dir(temp_config_dir: Path) -> Generator[Path, None, None]:
+def mock_config_dir(
+    temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
     """Mock ConfigManager directories to use temporary directory.
 
     This fixture patches all ConfigManager directory paths to use a
@@ -34,49 +35,57 @@ def mock_config_dir(temp_config_dir: Path) -> Generator[Path, None, None]:
 
     Args:
         temp_config_dir: Temporary config directory fixture
+        monkeypatch: pytest's built-in monkeypatch fixture
 
-    Yields:
+    Returns:
         Path to mocked config directory
     """
-    with (
-        patch.object(ConfigManager, "CONFIG_DIR", temp_config_dir),
-        patch.object(
-            ConfigManager,
-            "PROFILES_DIR",
-            temp_config_dir / "profiles",
-        ),
-        patch.object(
-            ConfigManager,
-            "DEFAULT_CONFIG_FILE",
-            temp_config_dir / "config.toml",
+    monkeypatch.setattr(ConfigManager, "CONFIG_DIR", temp_config_dir)
+    monkeypatch.setattr(
+        ConfigManager, "PROFILES_DIR", temp_config_dir / "profiles"
+    )
+    monkeypatch.setattr(
+        ConfigManager, "DEFAULT_CONFIG_FILE", temp_config_dir / "config.toml"
+    )
+    monkeypatch.setattr(
+        ConfigManager,
+        "ACTIVE_PROFILE_FILE",
+        temp_config_dir / ".active_profile",
+    )
+    return temp_config_dir
+
+
+# Shared, read-only sample config; every section is a read-only view too
+_SAMPLE_CONFIG_DATA: Mapping[str, Mapping[str, object]] = MappingProxyType(
+    {
+        "profile": MappingProxyType({"name": "test"}),
+        "auth": MappingProxyType({"api_key": "ak-test123"}),
+        "routing": MappingProxyType({"region": "us-east-1b"}),
+        "transport": MappingProxyType(
+            {
+                "stream_max_workers": 8,
+                "stream_max_queue_bound": 5000,
+                "pyarrow_max_chunksize": 10000,
+                "max_http_payload_size_mb": 8,
+            }
         ),
-        patch.object(
-            ConfigManager,
-            "ACTIVE_PROFILE_FILE",
-            temp_config_dir / ".active_profile",
+        "security": MappingProxyType({"request_verify": True}),
+        "storage": MappingProxyType(
+            {"directory": "~/.arize", "cache_enabled": True}
         ),
-    ):
-        yield temp_config_dir
+        "output": MappingProxyType({"format": "table"}),
+    }
+)
 
 
 @pytest.fixture
-def sample_config_data() -> dict[str, object]:
+def sample_config_data() -> Mapping[str, Mapping[str, object]]:
     """Provide sample configuration data for testing.
 
+    The same read-only mapping is shared by all tests; build a dict from
+    it to modify values.
+
     Returns:
-        Dictionary with valid configuration data
+        Mapping with valid configuration data
     """
-    return {
-        "profile": {"name": "test"},
-        "auth": {"api_key": "ak-test123"},
-        "routing": {"region": "us-east-1b"},
-        "transport": {
-            "stream_max_workers": 8,
-            "stream_max_queue_bound": 5000,
-            "pyarrow_max_chunksize": 10000,
-            "max_http_payload_size_mb": 8,
-        },
-        "security": {"request_verify": True},
-        "storage": {"directory": "~/.arize", "cache_enabled": True},
-        "output": {"format": "table"},
-    }
+    return _SAMPLE_CONFIG_DATA
@@ -0,0 +1,86 @@
+"""Tests for SDK client construction."""
+
+import inspect
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from arize import ArizeClient
+
+from ax.config.manager import ConfigManager
+from ax.config.schema import AuthConfig, Config
+from ax.core.client import clear_client_pool, get_client
+
+
+@pytest.fixture(autouse=True)
+def clear_pool() -> Generator[None, None, None]:
+    """Ensure each test builds its own clients."""
+    clear_client_pool()
+    yield
+    clear_client_pool()
+
+
+def test_get_client_reuses_client_per_profile(mock_config_dir: Path) -> None:
+    """Test get_client returns the same client for the same profile."""
+    ConfigManager.save(Config(auth=AuthConfig(api_key="ak-test123")))
+
+    client = get_client("default")
+    assert get_client("default") is client
+
+
+def test_get_client_uses_profile_api_key(mock_config_dir: Path) -> None:
+    """Test get_client configures the client from the profile."""
+    ConfigManager.save(Config(auth=AuthConfig(api_key="ak-test123")))
+
+    client = get_client("default")
+    assert client.sdk_config.api_key == "ak-test123"
+
+
+def test_get_client_shares_client_for_identical_configs(
+    mock_config_dir: Path,
+) -> None:
+    """Test profiles with the same settings share one client."""
+    config = Config(auth=AuthConfig(api_key="ak-test123"))
+    ConfigManager.save(config, profile="default")
+    ConfigManager.save(config, profile="dev")
+
+    assert get_client("dev") is get_client("default")
+
+
+def test_get_client_rebuilds_client_when_config_changes(
+    mock_config_dir: Path,
+) -> None:
+    """Test a changed profile gets a new client."""
+    ConfigManager.save(Config(auth=AuthConfig(api_key="ak-old")))
+    old_client = get_client("default")
+
+    ConfigManager.save(Config(auth=AuthConfig(api_key="ak-new")))
+    new_client = get_client("default")
+
+    assert new_client is not old_client
+    assert new_client.sdk_config.api_key == "ak-new"
+
+
+def test_get_client_builds_sdk_kwargs_once(mock_config_dir: Path) -> None:
+    """Test a pool miss converts the config to SDK arguments only once."""
+    ConfigManager.save(Config(auth=AuthConfig(api_key="ak-test123")))
+
+    with patch.object(
+        Config,
+        "to_sdk_kwargs",
+        autospec=True,
+        side_effect=Config.to_sdk_kwargs,
+    ) as to_sdk_kwargs:
+        get_client("default")
+
+    assert to_sdk_kwargs.call_count == 1
+
+
+def test_sdk_kwargs_are_client_keyword_arguments() -> None:
+    """Test every SDK config field is accepted by ArizeClient directly."""
+    config = Config(auth=AuthConfig(api_key="ak-test123"))
+    parameters = inspect.signature(ArizeClient.__init__).parameters
+
+    for name in config.to_sdk_kwargs():
+        assert parameters[name].kind is inspect.Parameter.KEYWORD_ONLY
@@ -0,0 +1,45 @@
+"""Tests for command decorators."""
+
+import pytest
+import typer
+
+from ax.core.decorators import handle_errors
+from ax.core.exceptions import FileIOError
+
+
+def test_handle_errors_returns_result() -> None:
+    """Test the wrapped function's result is passed through."""
+    assert handle_errors(lambda: 42)() == 42
+
+
+def test_handle_errors_reraises_typer_exit() -> None:
+    """Test typer.Exit keeps its own exit code."""
+
+    def command() -> None:
+        raise typer.Exit(code=7)
+
+    with pytest.raises(typer.Exit) as exc_info:
+        handle_errors(command)()
+    assert exc_info.value.exit_code == 7
+
+
+def test_handle_errors_uses_ax_error_exit_code() -> None:
+    """Test AxError subclasses exit with their exit code."""
+
+    def command() -> None:
+        raise FileIOError("boom")
+
+    with pytest.raises(typer.Exit) as exc_info:
+        handle_errors(command)()
+    assert exc_info.value.exit_code == FileIOError.exit_code
+
+
+def test_handle_errors_unexpected_error_exits_1() -> None:
+    """Test unexpected exceptions exit with code 1."""
+
+    def command() -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(typer.Exit) as exc_info:
+        handle_errors(command)()
+    assert exc_info.value.exit_code == 1
@@ -0,0 +1,173 @@
+"""Tests for error parsing and formatting."""
+
+import pytest
+from arize._generated.api_client.exceptions import ApiException
+
+from ax.core.error_formatter import (
+    ParsedError,
+    format_error_message,
+    is_verbose_mode,
+    parse_api_exception,
+    parse_exception,
+    parse_grpc_error,
+)
+
+
+class TestParseApiException:
+    """Test parsing of SDK API exceptions."""
+
+    def test_parses_chained_api_exception(self) -> None:
+        """Test status, reason and headers are taken from the ApiException."""
+        api_exception = ApiException(status=404, reason="Not Found")
+        api_exception.headers = {"x-request-id": "abc"}
+        error = ValueError("wrapper")
+        error.__cause__ = api_exception
+
+        parsed = parse_api_exception(error)
+
+        assert parsed is not None
+        assert parsed.status == 404
+        assert parsed.reason == "Not Found"
+        assert parsed.headers is api_exception.headers
+
+    def test_returns_none_without_api_exception(self) -> None:
+        """Test other exceptions are not parsed."""
+        assert parse_api_exception(ValueError("nothing")) is None
+
+
+class TestParseGrpcError:
+    """Test parsing of flight client gRPC errors."""
+
+    def test_parses_with_message_and_status(self) -> None:
+        """Test the 'with message' form is parsed along with the status."""
+        error = RuntimeError(
+            "Flight returned invalid argument error, with message: dataset X "
+            "already exists. gRPC client debug context: UNKNOWN:Error "
+            'received from peer {grpc_message:"other", grpc_status:6}'
+        )
+
+        parsed = parse_grpc_error(error)
+
+        assert parsed is not None
+        assert parsed.detail == "dataset X already exists"
+        assert parsed.status == 409
+        assert parsed.reason == "Conflict"
+
+    def test_falls_back_to_grpc_message(self) -> None:
+        """Test grpc_message is used when there is no 'with message' text."""
+        error = RuntimeError(
+            'debug context: {grpc_status:5, grpc_message:"dataset not found"}'
+        )
+
+        parsed = parse_grpc_error(error)
+
+        assert parsed is not None
+        assert parsed.detail == "dataset not found"
+        assert parsed.status == 404
+
+    def test_status_inside_message_is_found(self) -> None:
+        """Test a grpc_status inside the 'with message' text is still used."""
+        error = RuntimeError(
+            "with message: no such dataset grpc_status:5 gRPC debug"
+        )
+
+        parsed = parse_grpc_error(error)
+
+        assert parsed is not None
+        assert parsed.status == 404
+
+    def test_missing_status_maps_to_server_error(self) -> None:
+        """Test a message without a status maps to a 500."""
+        parsed = parse_grpc_error(RuntimeError('grpc_message:"boom"'))
+
+        assert parsed is not None
+        assert parsed.status == 500
+
+    def test_unknown_status_maps_to_server_error(self) -> None:
+        """Test a status outside the gRPC code range maps to a 500."""
+        parsed = parse_grpc_error(
+            RuntimeError('grpc_message:"x" grpc_status:17')
+        )
+
+        assert parsed is not None
+        assert parsed.status == 500
+        assert parsed.reason == "Server Error"
+
+    def test_walks_exception_chain(self) -> None:
+        """Test the RuntimeError is found through __cause__."""
+        error = ValueError("wrapper")
+        error.__cause__ = RuntimeError('grpc_message:"boom" grpc_status:16')
+
+        parsed = parse_grpc_error(error)
+
+        assert parsed is not None
+        assert parsed.status == 401
+
+    def test_returns_none_without_message(self) -> None:
+        """Test errors without a gRPC message are not parsed."""
+        assert parse_grpc_error(RuntimeError("grpc_status:5")) is None
+        assert parse_grpc_error(ValueError("nothing")) is None
+
+
+class TestParseException:
+    """Test parsing of arbitrary exception chains."""
+
+    def test_api_exception_takes_precedence(self) -> None:
+        """Test an ApiException deeper in the chain wins over a gRPC error."""
+        grpc_error = RuntimeError('grpc_message:"boom" grpc_status:5')
+        grpc_error.__cause__ = ApiException(status=403, reason="Forbidden")
+        error = ValueError("wrapper")
+        error.__cause__ = grpc_error
+
+        parsed = parse_exception(error)
+
+        assert parsed is not None
+        assert parsed.status == 403
+
+    def test_falls_back_to_grpc_error(self) -> None:
+        """Test a gRPC error is parsed when there is no ApiException."""
+        error = ValueError("wrapper")
+        error.__cause__ = RuntimeError('grpc_message:"boom" grpc_status:5')
+
+        parsed = parse_exception(error)
+
+        assert parsed is not None
+        assert parsed.status == 404
+        assert parsed.detail == "boom"
+
+    def test_returns_none_for_plain_errors(self) -> None:
+        """Test exceptions without API or gRPC details are not parsed."""
+        assert parse_exception(ValueError("nothing")) is None
+
+
+class TestFormatErrorMessage:
+    """Test error message formatting."""
+
+    def test_verbose_indents_body_lines(self) -> None:
+        """Test each line of the raw response body is indented."""
+        message = format_error_message(
+            ParsedError(status=500, reason="Server Error", body="a\nb"),
+            verbose=True,
+        )
+
+        assert "[bold]Raw Response Body:[/bold]\n  a\n  b" in message
+
+    def test_clean_includes_suggestion(self) -> None:
+        """Test clean mode shows status, detail and suggestion."""
+        message = format_error_message(
+            ParsedError(status=404, reason="Not Found", detail="no dataset")
+        )
+
+        assert message.startswith("404 Not Found; no dataset")
+        assert "Suggestion: Resource not found." in message
+
+
+def test_is_verbose_mode_reads_current_argv(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test verbose mode follows changes to sys.argv."""
+    monkeypatch.setattr("sys.argv", ["ax", "projects", "list"])
+    assert not is_verbose_mode()
+
+    monkeypatch.setattr("sys.argv", ["ax", "projects", "list", "-v"])
+    assert is_verbose_mode()
@@ -0,0 +1,149 @@
+"""Tests for output formatters."""
+
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pydantic import BaseModel
+
+from ax.core.output import (
+    BaseModelTableFormatter,
+    CSVFormatter,
+    JSONFormatter,
+    ParquetFormatter,
+    get_formatter,
+)
+from ax.utils.console import console
+
+
+class Item(BaseModel):
+    """List item with mixed column types."""
+
+    name: str
+    count: int
+    score: float
+
+
+class Container(BaseModel):
+    """Model with scalar metadata and a list field."""
+
+    id: str
+    items: list[Item]
+
+
+def test_base_model_table_renders_rows() -> None:
+    """Test list fields render one row per item with per-column types kept."""
+    model = Container(
+        id="c1",
+        items=[
+            Item(name="a", count=1, score=0.5),
+            Item(name="b", count=2, score=1.5),
+        ],
+    )
+
+    with console.capture() as capture:
+        BaseModelTableFormatter().format(model)
+    output = capture.get()
+
+    assert "Container Details" in output
+    assert "Items (2)" in output
+    assert "│ a    │ 1     │ 0.5   │" in output
+    assert "│ b    │ 2     │ 1.5   │" in output
+
+
+def test_base_model_table_formats_typed_columns() -> None:
+    """Test bool, datetime and missing values are formatted per column."""
+    rows = [
+        {"ok": True, "at": datetime(2024, 1, 2, 3, 4, 5), "tags": ["x"]},
+        {"ok": False, "at": None, "tags": []},
+    ]
+
+    columns = [
+        BaseModelTableFormatter()._format_column(series)
+        for _, series in pd.DataFrame(rows).items()
+    ]
+
+    assert columns == [
+        ["[green]True[/green]", "[red]False[/red]"],
+        ["2024-01-02 03:04:05", "[dim]None[/dim]"],
+        ["[dim]1 items[/dim]", "[dim][]"],
+    ]
+
+
+def test_json_formatter_writes_file(tmp_path: Path) -> None:
+    """Test JSON output omits None values and is indented."""
+    output_file = tmp_path / "out.json"
+
+    JSONFormatter().format(
+        Item(name="a", count=1, score=0.5), output_file=str(output_file)
+    )
+
+    assert json.loads(output_file.read_text()) == {
+        "name": "a",
+        "count": 1,
+        "score": 0.5,
+    }
+    assert output_file.read_text().startswith('{\n  "name": "a",')
+
+
+def test_csv_formatter_writes_stdout(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test CSV output to stdout is written verbatim."""
+    CSVFormatter().format(Item(name="[a]", count=1, score=0.5))
+
+    assert capsys.readouterr().out == "name,count,score\n[a],1,0.5\n"
+
+
+def test_csv_formatter_writes_single_model_file(tmp_path: Path) -> None:
+    """Test a single model is written as a header and one row."""
+    output_file = tmp_path / "out.csv"
+
+    CSVFormatter().format(
+        Item(name="a, b", count=1, score=0.5), output_file=str(output_file)
+    )
+
+    assert output_file.read_text() == 'name,count,score\n"a, b",1,0.5\n'
+
+
+def test_parquet_formatter_writes_single_model(tmp_path: Path) -> None:
+    """Test a single model is written as a one-row Parquet file."""
+    output_file = tmp_path / "out.parquet"
+
+    ParquetFormatter().format(
+        Item(name="a", count=1, score=0.5), output_file=str(output_file)
+    )
+
+    assert pd.read_parquet(output_file).to_dict("records") == [
+        {"name": "a", "count": 1, "score": 0.5}
+    ]
+
+
+def test_get_formatter_returns_shared_instance() -> None:
+    """Test formatters are looked up case-insensitively and reused."""
+    assert isinstance(get_formatter("JSON"), JSONFormatter)
+    assert get_formatter("json") is get_formatter("json")
+
+    with pytest.raises(ValueError, match="Unsupported format"):
+        get_formatter("xml")
+
+
+def test_format_value_datetime() -> None:
+    """Test datetimes are shown to the second."""
+    formatter = BaseModelTableFormatter()
+
+    assert (
+        formatter._format_value(datetime(2024, 1, 2, 3, 4, 5, 678))
+        == "2024-01-02 03:04:05"
+    )
+
+
+def test_import_does_not_load_pandas() -> None:
+    """Test pandas is only imported when a DataFrame is needed."""
+    code = "import sys, ax.core.output; assert 'pandas' not in sys.modules"
+
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
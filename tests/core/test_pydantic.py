@@ -0,0 +1,92 @@
+"""Tests for Pydantic model inspection utilities."""
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from ax.core.pydantic import (
+    categorize_basemodel_fields,
+    flatten_basemodel_for_export,
+    is_list_response_model,
+)
+
+
+class Item(BaseModel):
+    """List item."""
+
+    name: str
+
+
+class Container(BaseModel):
+    """Model with scalar metadata and list fields."""
+
+    id: str
+    tags: list[str]
+    items: list[Item]
+
+
+def _container() -> Container:
+    return Container(id="c1", tags=["a"], items=[Item(name="x")])
+
+
+def test_categorize_basemodel_fields() -> None:
+    """Test scalar and structured list fields are split apart."""
+    metadata, list_fields = categorize_basemodel_fields(_container())
+
+    assert metadata == {"id": "c1", "tags": ["a"]}
+    assert list_fields == {"items": [{"name": "x"}]}
+
+
+def test_categorize_uses_field_annotations() -> None:
+    """Test optional and empty structured lists are classified correctly."""
+
+    class Response(BaseModel):
+        items: list[Item] | None = None
+        rows: list[dict[str, int]] = []
+        labels: list[str] = []
+
+    metadata, list_fields = categorize_basemodel_fields(
+        Response(items=[Item(name="x")], labels=["a"])
+    )
+
+    assert metadata == {"rows": [], "labels": ["a"]}
+    assert list_fields == {"items": [{"name": "x"}]}
+
+
+def test_categorize_inspects_loosely_typed_lists() -> None:
+    """Test lists of unions or Any are classified by their values."""
+
+    class Other(BaseModel):
+        size: int
+
+    class Response(BaseModel):
+        mixed: list[Item | Other]
+        loose: list[Any]
+        blank: list[dict]
+
+    metadata, list_fields = categorize_basemodel_fields(
+        Response(mixed=[Item(name="x")], loose=[{"a": 1}], blank=[{}])
+    )
+
+    assert metadata == {"blank": [{}]}
+    assert list_fields == {"mixed": [{"name": "x"}], "loose": [{"a": 1}]}
+
+
+def test_flatten_basemodel_for_export() -> None:
+    """Test list fields are replaced by their counts."""
+    assert flatten_basemodel_for_export(_container()) == {
+        "id": "c1",
+        "tags": ["a"],
+        "num_items": 1,
+    }
+
+
+def test_is_list_response_model() -> None:
+    """Test only models with a pagination field are list responses."""
+
+    class ListResponse(BaseModel):
+        items: list[Item]
+        pagination: dict
+
+    assert is_list_response_model(ListResponse(items=[], pagination={}))
+    assert not is_list_response_model(_container())
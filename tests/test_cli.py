@@ -0,0 +1,66 @@
+"""Tests for the top-level CLI application."""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ax.cli import app
+from ax.config.manager import ConfigManager
+from ax.config.schema import AuthConfig, Config, StorageConfig
+
+runner = CliRunner()
+
+
+def test_command_accepts_verbose_flag(mock_config_dir: Path) -> None:
+    """Test that subcommands accept -v after the command name."""
+    result = runner.invoke(app, ["cache", "clear", "-v"], input="n\n")
+
+    assert result.exit_code == 0
+    assert "No such option" not in result.output
+
+
+def test_cache_clear_empties_cache_dir(mock_config_dir: Path) -> None:
+    """Test that cache clear leaves an empty cache directory behind."""
+    config = Config(
+        auth=AuthConfig(api_key="ak-test123"),
+        storage=StorageConfig(directory=str(mock_config_dir)),
+    )
+    ConfigManager.save(config, profile="default")
+    cache_dir = mock_config_dir / "cache"
+    (cache_dir / "nested").mkdir(parents=True)
+    (cache_dir / "nested" / "data.bin").write_bytes(b"x")
+
+    result = runner.invoke(app, ["cache", "clear"], input="y\n")
+
+    assert result.exit_code == 0
+    assert cache_dir.is_dir()
+    assert not any(cache_dir.iterdir())
+    assert sorted(p.name for p in mock_config_dir.iterdir()) == [
+        "cache",
+        "config.toml",
+        "profiles",
+    ]
+
+
+def test_cache_clear_reports_delete_failure(
+    mock_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed delete is reported instead of claiming success."""
+    config = Config(
+        auth=AuthConfig(api_key="ak-test123"),
+        storage=StorageConfig(directory=str(mock_config_dir)),
+    )
+    ConfigManager.save(config, profile="default")
+    (mock_config_dir / "cache").mkdir()
+
+    def fail(path: Path) -> None:
+        raise PermissionError(f"Permission denied: '{path}'")
+
+    monkeypatch.setattr("ax.commands.cache.shutil.rmtree", fail)
+
+    result = runner.invoke(app, ["cache", "clear"], input="y\n")
+
+    assert result.exit_code == 1
+    assert "Permission denied" in result.output
+    assert "Cache cleared successfully" not in result.output
@@ -0,0 +1,128 @@
+"""Tests for file I/O utilities."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ax.core.exceptions import FileIOError
+from ax.utils.file_io import (
+    parse_output_option,
+    read_data_file,
+    write_data_file,
+    write_parquet,
+)
+
+DF = pd.DataFrame({"name": ["a", "b"], "count": [1, 2], "score": [0.5, 1.5]})
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".jsonl", ".parquet"])
+def test_write_then_read_round_trips(tmp_path: Path, suffix: str) -> None:
+    """Test each supported format reads back what was written."""
+    path = tmp_path / f"data{suffix}"
+
+    write_data_file(DF, str(path))
+
+    pd.testing.assert_frame_equal(read_data_file(str(path)), DF)
+
+
+def test_read_jsonl_skips_blank_lines(tmp_path: Path) -> None:
+    """Test blank lines in JSON Lines files are ignored."""
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1}\n\n{"a": 2}\n')
+
+    assert read_data_file(str(path))["a"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("suffix", [".json", ".jsonl"])
+def test_read_json_converts_dates(tmp_path: Path, suffix: str) -> None:
+    """Test JSON input keeps pandas' date and index conversion."""
+    rows = [
+        {"id": 1, "created_at": "2024-01-02T03:04:05", "timestamp": 1704164645},
+        {"id": 2, "created_at": "2024-02-03T04:05:06", "timestamp": 1706933106},
+    ]
+    path = tmp_path / f"data{suffix}"
+    if suffix == ".jsonl":
+        path.write_text("\n".join(json.dumps(row) for row in rows))
+    else:
+        path.write_text(json.dumps(rows))
+
+    df = read_data_file(str(path))
+
+    assert df["id"].dtype == "int64"
+    assert pd.api.types.is_datetime64_any_dtype(df["created_at"])
+    assert pd.api.types.is_datetime64_any_dtype(df["timestamp"])
+    assert df.index.tolist() == [0, 1]
+
+
+def test_read_column_oriented_json_has_integer_index(tmp_path: Path) -> None:
+    """Test column-oriented JSON gets an integer index."""
+    path = tmp_path / "data.json"
+    path.write_text('{"a": {"0": 1, "1": 2}}')
+
+    assert read_data_file(str(path)).index.tolist() == [0, 1]
+
+
+def test_read_invalid_json_raises(tmp_path: Path) -> None:
+    """Test malformed files raise FileIOError."""
+    path = tmp_path / "data.json"
+    path.write_text("{not json")
+
+    with pytest.raises(FileIOError, match="Failed to read file"):
+        read_data_file(str(path))
+
+
+def test_read_missing_file_raises(tmp_path: Path) -> None:
+    """Test missing files raise FileIOError."""
+    with pytest.raises(FileIOError, match="File not found"):
+        read_data_file(str(tmp_path / "missing.csv"))
+
+
+def test_write_parquet_uses_zstd(tmp_path: Path) -> None:
+    """Test Parquet files are written with zstd compression."""
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "data.parquet"
+
+    write_data_file(DF, str(path))
+
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_write_parquet_streams_large_frames(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test frames above the threshold are written one row group at a time."""
+    import pyarrow.parquet as pq
+
+    monkeypatch.setattr("ax.utils.file_io.PARQUET_STREAM_THRESHOLD", 2)
+    monkeypatch.setattr("ax.utils.file_io.PARQUET_ROW_GROUP_SIZE", 2)
+    df = pd.DataFrame({"name": list("abcde"), "count": range(5)})
+    path = tmp_path / "data.parquet"
+
+    write_parquet(df, str(path))
+
+    assert pq.ParquetFile(path).metadata.num_row_groups == 3
+    pd.testing.assert_frame_equal(read_data_file(str(path)), df)
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        ("json", ("json", "")),
+        ("out.CSV", ("csv", "out.CSV")),
+        ("out.pq", ("parquet", "out.pq")),
+    ],
+)
+def test_parse_output_option(output: str, expected: tuple[str, str]) -> None:
+    """Test format names and file paths are both accepted."""
+    assert parse_output_option(output) == expected
+
+
+def test_parse_output_option_rejects_unknown_extension() -> None:
+    """Test unknown extensions raise FileIOError every time."""
+    for _ in range(2):
+        with pytest.raises(FileIOError, match="Invalid output option"):
+            parse_output_option("out.xml")